@@ -17,6 +17,7 @@ This CLI uses the following exit code patterns:
 """
 
 import logging
+import re
 import sys
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -39,6 +40,7 @@ from dbt_conceptual.git import (
     compute_diff_from_ref,
 )
 from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.serialization import write_yaml
 from dbt_conceptual.state import ConceptState, ProjectState
 from dbt_conceptual.validator import Severity, Validator
 
@@ -47,6 +49,9 @@ console = Console()
 # Global quiet flag - set by main() based on --quiet option
 _quiet_mode = False
 
+# Model name prefixes stripped when deriving stub concept IDs in sync
+_MODEL_PREFIX_RE = re.compile(r"^(?:dim_|fact_|stg_|fct_|bridge_)")
+
 
 def _print(message: str, style: Optional[str] = None) -> None:
     """Print message unless quiet mode is enabled.
@@ -127,14 +132,17 @@ def status(
     console.print("\n[bold]Concepts by Domain[/bold]")
     console.print("=" * 50)
 
+    # Group concepts by domain once instead of rescanning per domain
+    concepts_by_domain: dict[Optional[str], list[tuple[str, ConceptState]]] = {}
+    for cid, c in state.concepts.items():
+        concepts_by_domain.setdefault(c.domain or None, []).append((cid, c))
+
     if not state.domains:
         console.print("[yellow]No domains defined[/yellow]\n")
     else:
         for domain_id, domain in state.domains.items():
             # Count concepts in this domain
-            domain_concepts = [
-                (cid, c) for cid, c in state.concepts.items() if c.domain == domain_id
-            ]
+            domain_concepts = concepts_by_domain.get(domain_id, [])
 
             console.print(
                 f"\n[cyan]{domain.display_name}[/cyan] ({len(domain_concepts)} concepts)"
@@ -144,7 +152,7 @@ def status(
                 _print_concept_status(concept_id, concept)
 
     # Show concepts without domain
-    no_domain = [(cid, c) for cid, c in state.concepts.items() if not c.domain]
+    no_domain = concepts_by_domain.get(None, [])
     if no_domain:
         console.print("\n[cyan]No Domain[/cyan]")
         for concept_id, concept in no_domain:
@@ -352,9 +360,9 @@ def _output_github_format(
     conceptual_file = str(config.conceptual_file)
 
     for issue in issues:
-        if issue.severity == Severity.ERROR:
+        if issue.severity is Severity.ERROR:
             level = "error"
-        elif issue.severity == Severity.WARNING:
+        elif issue.severity is Severity.WARNING:
             level = "warning"
         else:
             level = "notice"
@@ -395,9 +403,9 @@ def _output_markdown_format(
     print()
 
     # Group issues by severity
-    errors = [i for i in issues if i.severity == Severity.ERROR]
-    warnings = [i for i in issues if i.severity == Severity.WARNING]
-    infos = [i for i in issues if i.severity == Severity.INFO]
+    errors = [i for i in issues if i.severity is Severity.ERROR]
+    warnings = [i for i in issues if i.severity is Severity.WARNING]
+    infos = [i for i in issues if i.severity is Severity.INFO]
 
     # Errors
     if errors:
@@ -474,9 +482,9 @@ def _output_human_format(
         console.print("=" * 80)
 
         # Group by severity
-        errors = [i for i in issues if i.severity == Severity.ERROR]
-        warnings = [i for i in issues if i.severity == Severity.WARNING]
-        infos = [i for i in issues if i.severity == Severity.INFO]
+        errors = [i for i in issues if i.severity is Severity.ERROR]
+        warnings = [i for i in issues if i.severity is Severity.WARNING]
+        infos = [i for i in issues if i.severity is Severity.INFO]
 
         if errors:
             console.print("\n[red bold]✗ ERRORS[/red bold]")
@@ -662,11 +670,7 @@ def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str])
     for orphan in orphans:
         # Generate concept ID from model name
         # Strip prefixes like dim_, fact_, stg_
-        concept_id = orphan.name
-        for prefix in ["dim_", "fact_", "stg_", "fct_", "bridge_"]:
-            if concept_id.startswith(prefix):
-                concept_id = concept_id[len(prefix) :]
-                break
+        concept_id = _MODEL_PREFIX_RE.sub("", orphan.name, count=1)
 
         # Check if concept already exists
         if concept_id in conceptual_data["concepts"]:
@@ -698,8 +702,7 @@ def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str])
         return
 
     # Write back to file
-    with open(config.conceptual_file, "w") as f:
-        yaml.dump(conceptual_data, f, default_flow_style=False, sort_keys=False)
+    write_yaml(config.conceptual_file, conceptual_data)
 
     console.print(f"\n[green]✓ Created {len(stubs_created)} stub concept(s):[/green]")
     for model_name, concept_id in stubs_created:
@@ -968,7 +971,8 @@ def _get_output_stream(output: Optional[Path]) -> Generator[TextIO, None, None]:
         File handle or sys.stdout
     """
     if output:
-        f = open(output, "w")
+        # Exporters emit many small writes; a 64 KiB buffer batches them
+        f = open(output, "w", encoding="utf-8", buffering=1 << 16)
         try:
             yield f
         finally:
@@ -1001,7 +1005,16 @@ def _get_output_stream(output: Optional[Path]) -> Generator[TextIO, None, None]:
     default=False,
     help="Launch with a self-contained demo project (no dbt project required)",
 )
-def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None:
+@click.option(
+    "--debug",
+    is_flag=True,
+    default=False,
+    help="Run the Flask development server with debugger and auto-reload "
+    "(loopback hosts only)",
+)
+def serve(
+    project_dir: Optional[Path], host: str, port: int, demo: bool, debug: bool
+) -> None:
     """Launch the interactive web UI for editing conceptual models.
 
     This starts a local web server with a visual editor for your conceptual
@@ -1017,13 +1030,14 @@ def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None
         dbt-conceptual serve --port 8080
         dbt-conceptual serve --host 0.0.0.0 --port 3000
         dbt-conceptual serve --demo
+        dbt-conceptual serve --debug
 
     Note:
         Port 5000 is often occupied by macOS AirPlay Receiver.
         Default is 8050 to avoid conflicts.
     """
     try:
-        from dbt_conceptual.server import run_server
+        from dbt_conceptual.server import LOOPBACK_HOSTS, run_server
     except ImportError:
         console.print(
             "[red]Error: Server dependencies not installed.[/red]\n\n"
@@ -1032,6 +1046,13 @@ def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None
         )
         return
 
+    # The Werkzeug debugger executes arbitrary code for anyone who reaches it
+    if debug and host not in LOOPBACK_HOSTS:
+        raise click.UsageError(
+            f"--debug is only allowed on a loopback host "
+            f"({', '.join(sorted(LOOPBACK_HOSTS))}), not '{host}'"
+        )
+
     # Handle demo mode
     demo_dir: Optional[Path] = None
     if demo:
@@ -1060,7 +1081,13 @@ def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None
     console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
     try:
-        run_server(project_dir or Path.cwd(), host=host, port=port, demo_mode=demo)
+        run_server(
+            project_dir or Path.cwd(),
+            host=host,
+            port=port,
+            demo_mode=demo,
+            debug=debug,
+        )
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped[/yellow]")
 
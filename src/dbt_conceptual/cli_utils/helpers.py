@@ -1,14 +1,15 @@
 """Shared CLI helpers and utilities."""
 
+import inspect
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
 import click
 
-from dbt_conceptual.config import Config
-from dbt_conceptual.parser import StateBuilder
-from dbt_conceptual.state import ProjectState
+if TYPE_CHECKING:
+    from dbt_conceptual.config import Config
+    from dbt_conceptual.state import ProjectState
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -24,7 +25,7 @@ class ConceptualFileNotFound(Exception):
 def load_project_state(
     project_dir: Optional[Path] = None,
     gold_paths: Optional[list[str]] = None,
-) -> tuple[ProjectState, Config]:
+) -> tuple["ProjectState", "Config"]:
     """Load project configuration and state.
 
     Args:
@@ -37,6 +38,10 @@ def load_project_state(
     Raises:
         ConceptualFileNotFound: If conceptual.yml doesn't exist
     """
+    # Deferred so importing the CLI helpers does not load YAML parsing
+    from dbt_conceptual.config import Config
+    from dbt_conceptual.parser import StateBuilder
+
     config = Config.load(
         project_dir=project_dir,
         gold_paths=gold_paths,
@@ -87,12 +92,13 @@ def require_conceptual_yml(f: F) -> F:
     accepts them.
     """
 
+    # Resolve which objects to inject once, not on every invocation
+    parameters = inspect.signature(f).parameters
+    inject_state = "state" in parameters
+    inject_config = "config" in parameters
+
     @wraps(f)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        from rich.console import Console
-
-        console = Console()
-
         project_dir = kwargs.get("project_dir")
         gold_paths = kwargs.get("gold_paths", ())
 
@@ -102,17 +108,17 @@ def require_conceptual_yml(f: F) -> F:
                 gold_paths=list(gold_paths) if gold_paths else None,
             )
         except ConceptualFileNotFound as e:
+            from rich.console import Console
+
+            console = Console()
             console.print(f"[red]Error: conceptual.yml not found at {e.path}[/red]")
             console.print("\nRun 'dbt-conceptual init' to create it.")
             raise click.Abort() from None
 
         # Inject state and config if the function accepts them
-        import inspect
-
-        sig = inspect.signature(f)
-        if "state" in sig.parameters:
+        if inject_state:
             kwargs["state"] = state
-        if "config" in sig.parameters:
+        if inject_config:
             kwargs["config"] = config
 
         return f(*args, **kwargs)
@@ -3,13 +3,95 @@
 All configuration is loaded from conceptual.yml in the project root.
 """
 
+import copy
+import fnmatch
+import os
+import re
+import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+from dbt_conceptual.serialization import SafeLoader
+
+# Files modified this recently are re-parsed: with a coarse mtime clock a
+# same-size rewrite could otherwise keep the stat key of the previous parse
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy_mtime(mtime_ns: int) -> bool:
+    """Check whether a file was modified too recently to trust its stat key.
+
+    Args:
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Returns:
+        True if a same-size rewrite could still keep this modification time
+    """
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+
+def _read_conceptual(path: str) -> Any:
+    """Parse a conceptual.yml."""
+    with open(path) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _read_conceptual_cached(path: str, mtime_ns: int, size: int, inode: int) -> Any:
+    """Parse a conceptual.yml; the stat fields only serve as cache key."""
+    return _read_conceptual(path)
+
+
+def load_conceptual_data(path: Path) -> Any:
+    """Parse conceptual.yml, reusing the previous parse while it is unchanged.
+
+    The file is re-read whenever its modification time, size or inode
+    changes, and on every call while it was modified within the last two
+    seconds. Each caller gets its own copy of the data.
+
+    Args:
+        path: Path to conceptual.yml
+
+    Returns:
+        Parsed YAML document, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if is_racy_mtime(stat.st_mtime_ns):
+        return _read_conceptual(str(path))
+    return copy.deepcopy(
+        _read_conceptual_cached(str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    )
+
+
+@lru_cache(maxsize=16)
+def _compile_layer_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[re.Pattern, tuple[str, ...]]:
+    """Combine layer glob patterns into one regex plus literal path prefixes.
+
+    A path belongs to the layer if it matches any glob (fnmatch semantics)
+    or starts with the non-glob portion of any pattern.
+
+    Args:
+        patterns: Glob patterns of the layer
+
+    Returns:
+        Tuple of (combined glob regex, non-glob prefixes)
+    """
+    glob = re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns) or "(?!)"
+    )
+    prefixes = tuple(base for p in patterns if (base := p.split("*")[0].rstrip("/")))
+    return glob, prefixes
+
 
 class RuleSeverity(Enum):
     """Configurable validation rule severity."""
@@ -105,41 +187,57 @@ class Config:
         else:
             project_dir = Path(project_dir)
 
+        data = load_conceptual_data(project_dir / "conceptual.yml")
+        return cls.from_mapping(data, project_dir=project_dir, gold_paths=gold_paths)
+
+    @classmethod
+    def from_mapping(
+        cls,
+        data: Any,
+        project_dir: Path,
+        gold_paths: Optional[list[str]] = None,
+    ) -> "Config":
+        """Build configuration from already parsed conceptual.yml contents.
+
+        Priority: CLI flags > conceptual.yml config section > defaults
+
+        Args:
+            data: Parsed conceptual.yml document (None for a missing file)
+            project_dir: Project directory
+            gold_paths: CLI override for gold layer paths
+
+        Returns:
+            Config instance
+        """
         # Start with defaults
         config_gold_paths: list[str] = ["models/marts/**/*.yml"]
         validation_config = ValidationConfig()
 
-        # Try to load from conceptual.yml
-        conceptual_file = project_dir / "conceptual.yml"
-        if conceptual_file.exists():
-            with open(conceptual_file) as f:
-                data = yaml.safe_load(f)
-
-            if data and "config" in data:
-                config_section = data["config"]
-
-                # Parse scan paths
-                if "scan" in config_section:
-                    scan_config = config_section["scan"]
-                    if "gold" in scan_config:
-                        gold_val = scan_config["gold"]
-                        if isinstance(gold_val, list):
-                            config_gold_paths = gold_val
-                        elif isinstance(gold_val, str):
-                            config_gold_paths = [gold_val]
-
-                # Parse validation config
-                if "validation" in config_section:
-                    validation_config = cls._parse_validation_config(
-                        config_section["validation"]
-                    )
+        if data and "config" in data:
+            config_section = data["config"]
+
+            # Parse scan paths
+            if "scan" in config_section:
+                scan_config = config_section["scan"]
+                if "gold" in scan_config:
+                    gold_val = scan_config["gold"]
+                    if isinstance(gold_val, list):
+                        config_gold_paths = list(gold_val)
+                    elif isinstance(gold_val, str):
+                        config_gold_paths = [gold_val]
+
+            # Parse validation config
+            if "validation" in config_section:
+                validation_config = cls._parse_validation_config(
+                    config_section["validation"]
+                )
 
         # Apply CLI overrides
         if gold_paths is not None:
             config_gold_paths = gold_paths
 
         return cls(
-            project_dir=project_dir,
+            project_dir=Path(project_dir),
             gold_paths=config_gold_paths,
             validation=validation_config,
         )
@@ -202,15 +300,8 @@ class Config:
         Returns:
             'gold' if path matches gold paths, None otherwise
         """
-        import fnmatch
-
-        for pattern in self.gold_paths:
-            # Handle glob patterns
-            if fnmatch.fnmatch(model_path, pattern):
-                return "gold"
-            # Also check if path starts with the non-glob portion
-            base_pattern = pattern.split("*")[0].rstrip("/")
-            if base_pattern and model_path.startswith(base_pattern):
-                return "gold"
+        glob, prefixes = _compile_layer_patterns(tuple(self.gold_paths))
+        if glob.match(os.path.normcase(model_path)) or model_path.startswith(prefixes):
+            return "gold"
 
         return None
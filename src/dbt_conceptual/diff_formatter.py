@@ -1,9 +1,71 @@
 """Formatters for diff output."""
 
-import json
+from collections import Counter
+from collections.abc import Callable
 from typing import Any
 
-from .differ import ConceptualDiff
+from .differ import ChangeType, ConceptualDiff
+from .serialization import dumps_json
+
+
+def _preview(text: Any) -> Any:
+    """Truncate long definitions to 50 characters."""
+    return (text[:50] + "...") if text and len(text) > 50 else text
+
+
+def _human_domain_added(change: Any) -> list[str]:
+    return [f"  + {change.key} - {change.new_value.display_name}"]
+
+
+def _human_domain_removed(change: Any) -> list[str]:
+    return [f"  - {change.key} - {change.old_value.display_name}"]
+
+
+def _human_concept_added(change: Any) -> list[str]:
+    concept = change.new_value
+    domain_info = f" ({concept.domain})" if concept.domain else " (no domain)"
+    return [f"  + {change.key}{domain_info} - {concept.status}"]
+
+
+def _human_concept_removed(change: Any) -> list[str]:
+    concept = change.old_value
+    domain_info = f" ({concept.domain})" if concept.domain else " (no domain)"
+    return [f"  - {change.key}{domain_info}"]
+
+
+def _human_relationship_added(change: Any) -> list[str]:
+    rel = change.new_value
+    cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""
+    return [f"  + {change.key}{cardinality_info}"]
+
+
+def _human_relationship_removed(change: Any) -> list[str]:
+    rel = change.old_value
+    cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""
+    return [f"  - {change.key}{cardinality_info}"]
+
+
+def _human_modified(change: Any) -> list[str]:
+    lines = [f"  ~ {change.key}"]
+    for field, old, new in change.modified_fields:
+        if field == "definition":
+            old, new = _preview(old), _preview(new)
+        lines.append(f"      {field}: {old!r} → {new!r}")
+    return lines
+
+
+# Line builders for format_human, keyed by (section, change type)
+_HUMAN_FORMATTERS: dict[tuple[str, ChangeType], Callable[[Any], list[str]]] = {
+    ("domain", ChangeType.ADDED): _human_domain_added,
+    ("domain", ChangeType.REMOVED): _human_domain_removed,
+    ("domain", ChangeType.MODIFIED): _human_modified,
+    ("concept", ChangeType.ADDED): _human_concept_added,
+    ("concept", ChangeType.REMOVED): _human_concept_removed,
+    ("concept", ChangeType.MODIFIED): _human_modified,
+    ("relationship", ChangeType.ADDED): _human_relationship_added,
+    ("relationship", ChangeType.REMOVED): _human_relationship_removed,
+    ("relationship", ChangeType.MODIFIED): _human_modified,
+}
 
 
 def format_human(diff: ConceptualDiff) -> str:
@@ -20,85 +82,100 @@ def format_human(diff: ConceptualDiff) -> str:
 
     lines = ["Conceptual Changes", "=" * 50, ""]
 
-    # Domain changes
-    if diff.domain_changes:
-        lines.append("Domains:")
+    sections: tuple[tuple[str, str, list[Any]], ...] = (
+        ("Domains:", "domain", diff.domain_changes),
+        ("Concepts:", "concept", diff.concept_changes),
+        ("Relationships:", "relationship", diff.relationship_changes),
+    )
+    for title, section, changes in sections:
+        if not changes:
+            continue
+        lines.append(title)
         lines.append("-" * 50)
-        for domain_change in diff.domain_changes:
-            if domain_change.change_type == "added":
-                lines.append(f"  + {domain_change.key} - {domain_change.new_value.display_name}")  # type: ignore
-            elif domain_change.change_type == "removed":
-                lines.append(f"  - {domain_change.key} - {domain_change.old_value.display_name}")  # type: ignore
-            elif domain_change.change_type == "modified":
-                lines.append(f"  ~ {domain_change.key}")
-                for field, (old, new) in domain_change.modified_fields.items():
-                    lines.append(f"      {field}: {old!r} → {new!r}")
+        for change in changes:
+            lines.extend(_HUMAN_FORMATTERS[section, change.change_type](change))
         lines.append("")
 
-    # Concept changes
-    if diff.concept_changes:
-        lines.append("Concepts:")
-        lines.append("-" * 50)
-        for concept_change in diff.concept_changes:
-            if concept_change.change_type == "added":
-                concept = concept_change.new_value
-                domain_info = f" ({concept.domain})" if concept.domain else " (no domain)"  # type: ignore
-                status_info = f" - {concept.status}"  # type: ignore
-                lines.append(f"  + {concept_change.key}{domain_info}{status_info}")
-            elif concept_change.change_type == "removed":
-                concept = concept_change.old_value
-                domain_info = f" ({concept.domain})" if concept.domain else " (no domain)"  # type: ignore
-                lines.append(f"  - {concept_change.key}{domain_info}")
-            elif concept_change.change_type == "modified":
-                lines.append(f"  ~ {concept_change.key}")
-                for field, (old, new) in concept_change.modified_fields.items():
-                    if field == "definition":
-                        # Truncate long definitions
-                        old_preview = (
-                            (old[:50] + "...") if old and len(old) > 50 else old
-                        )
-                        new_preview = (
-                            (new[:50] + "...") if new and len(new) > 50 else new
-                        )
-                        lines.append(
-                            f"      {field}: {old_preview!r} → {new_preview!r}"
-                        )
-                    else:
-                        lines.append(f"      {field}: {old!r} → {new!r}")
-        lines.append("")
+    return "\n".join(lines)
 
-    # Relationship changes
-    if diff.relationship_changes:
-        lines.append("Relationships:")
-        lines.append("-" * 50)
-        for rel_change in diff.relationship_changes:
-            if rel_change.change_type == "added":
-                rel = rel_change.new_value
-                cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""  # type: ignore
-                lines.append(f"  + {rel_change.key}{cardinality_info}")
-            elif rel_change.change_type == "removed":
-                rel = rel_change.old_value
-                cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""  # type: ignore
-                lines.append(f"  - {rel_change.key}{cardinality_info}")
-            elif rel_change.change_type == "modified":
-                lines.append(f"  ~ {rel_change.key}")
-                for field, (old, new) in rel_change.modified_fields.items():
-                    if field == "definition":
-                        # Truncate long definitions
-                        old_preview = (
-                            (old[:50] + "...") if old and len(old) > 50 else old
-                        )
-                        new_preview = (
-                            (new[:50] + "...") if new and len(new) > 50 else new
-                        )
-                        lines.append(
-                            f"      {field}: {old_preview!r} → {new_preview!r}"
-                        )
-                    else:
-                        lines.append(f"      {field}: {old!r} → {new!r}")
-        lines.append("")
 
-    return "\n".join(lines)
+def _field_names(change: Any) -> str:
+    """Comma-separated names of the fields a change modified."""
+    return ", ".join(name for name, _, _ in change.modified_fields)
+
+
+# GitHub Actions annotation templates, bound once at import
+_GH_NEW_DOMAIN = "::notice title=New Domain::{} - {}".format
+_GH_REMOVED_DOMAIN = "::warning title=Removed Domain::{} - {}".format
+_GH_MODIFIED_DOMAIN = "::notice title=Modified Domain::{} ({})".format
+_GH_NEW_CONCEPT = "::notice title=New Concept::{}{}".format
+_GH_NEW_DRAFT_CONCEPT = "::warning title=New Concept::{}{} - {}".format
+_GH_REMOVED_CONCEPT = "::warning title=Removed Concept::{}{}".format
+_GH_MODIFIED_CONCEPT = "::notice title=Modified Concept::{} ({})".format
+_GH_NEW_RELATIONSHIP = "::notice title=New Relationship::{}{}".format
+_GH_REMOVED_RELATIONSHIP = "::warning title=Removed Relationship::{}{}".format
+_GH_MODIFIED_RELATIONSHIP = "::notice title=Modified Relationship::{} ({})".format
+
+
+def _github_domain_added(change: Any) -> str:
+    return _GH_NEW_DOMAIN(change.key, change.new_value.display_name)
+
+
+def _github_domain_removed(change: Any) -> str:
+    return _GH_REMOVED_DOMAIN(change.key, change.old_value.display_name)
+
+
+def _github_domain_modified(change: Any) -> str:
+    return _GH_MODIFIED_DOMAIN(change.key, _field_names(change))
+
+
+def _github_concept_added(change: Any) -> str:
+    concept = change.new_value
+    domain_info = f" ({concept.domain})" if concept.domain else " (no domain)"
+    if concept.status in ("stub", "draft"):
+        return _GH_NEW_DRAFT_CONCEPT(change.key, domain_info, concept.status)
+    return _GH_NEW_CONCEPT(change.key, domain_info)
+
+
+def _github_concept_removed(change: Any) -> str:
+    concept = change.old_value
+    domain_info = f" ({concept.domain})" if concept.domain else ""
+    return _GH_REMOVED_CONCEPT(change.key, domain_info)
+
+
+def _github_concept_modified(change: Any) -> str:
+    return _GH_MODIFIED_CONCEPT(change.key, _field_names(change))
+
+
+# v1.0: relationships don't have a status property
+def _github_relationship_added(change: Any) -> str:
+    rel = change.new_value
+    cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""
+    return _GH_NEW_RELATIONSHIP(change.key, cardinality_info)
+
+
+def _github_relationship_removed(change: Any) -> str:
+    rel = change.old_value
+    cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""
+    return _GH_REMOVED_RELATIONSHIP(change.key, cardinality_info)
+
+
+def _github_relationship_modified(change: Any) -> str:
+    return _GH_MODIFIED_RELATIONSHIP(change.key, _field_names(change))
+
+
+# Annotation builders for format_github, keyed by (section, change type)
+_GITHUB_FORMATTERS: dict[tuple[str, ChangeType], Callable[[Any], str]] = {
+    ("domain", ChangeType.ADDED): _github_domain_added,
+    ("domain", ChangeType.REMOVED): _github_domain_removed,
+    ("domain", ChangeType.MODIFIED): _github_domain_modified,
+    ("concept", ChangeType.ADDED): _github_concept_added,
+    ("concept", ChangeType.REMOVED): _github_concept_removed,
+    ("concept", ChangeType.MODIFIED): _github_concept_modified,
+    ("relationship", ChangeType.ADDED): _github_relationship_added,
+    ("relationship", ChangeType.REMOVED): _github_relationship_removed,
+    ("relationship", ChangeType.MODIFIED): _github_relationship_modified,
+}
 
 
 def format_github(diff: ConceptualDiff) -> str:
@@ -114,70 +191,16 @@ def format_github(diff: ConceptualDiff) -> str:
         print("::notice title=Conceptual Model::No changes detected")
         return ""
 
-    lines = []
-
-    # Domain changes
-    for domain_change in diff.domain_changes:
-        if domain_change.change_type == "added":
-            lines.append(
-                f"::notice title=New Domain::{domain_change.key} - {domain_change.new_value.display_name}"  # type: ignore
-            )
-        elif domain_change.change_type == "removed":
-            lines.append(
-                f"::warning title=Removed Domain::{domain_change.key} - {domain_change.old_value.display_name}"  # type: ignore
-            )
-        elif domain_change.change_type == "modified":
-            modified_fields_str = ", ".join(domain_change.modified_fields.keys())
-            lines.append(
-                f"::notice title=Modified Domain::{domain_change.key} ({modified_fields_str})"
-            )
-
-    # Concept changes
-    for concept_change in diff.concept_changes:
-        if concept_change.change_type == "added":
-            concept = concept_change.new_value
-            domain_info = f" ({concept.domain})" if concept.domain else " (no domain)"  # type: ignore
-            if concept.status in ("stub", "draft"):  # type: ignore
-                lines.append(
-                    f"::warning title=New Concept::{concept_change.key}{domain_info} - {concept.status}"  # type: ignore
-                )
-            else:
-                lines.append(
-                    f"::notice title=New Concept::{concept_change.key}{domain_info}"
-                )
-        elif concept_change.change_type == "removed":
-            concept = concept_change.old_value
-            domain_info = f" ({concept.domain})" if concept.domain else ""  # type: ignore
-            lines.append(
-                f"::warning title=Removed Concept::{concept_change.key}{domain_info}"
-            )
-        elif concept_change.change_type == "modified":
-            modified_fields_str = ", ".join(concept_change.modified_fields.keys())
-            lines.append(
-                f"::notice title=Modified Concept::{concept_change.key} ({modified_fields_str})"
-            )
-
-    # Relationship changes (v1.0: relationships don't have a status property)
-    for rel_change in diff.relationship_changes:
-        if rel_change.change_type == "added":
-            rel = rel_change.new_value
-            cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""  # type: ignore
-            lines.append(
-                f"::notice title=New Relationship::{rel_change.key}{cardinality_info}"
-            )
-        elif rel_change.change_type == "removed":
-            rel = rel_change.old_value
-            cardinality_info = f" ({rel.cardinality})" if rel.cardinality else ""  # type: ignore
-            lines.append(
-                f"::warning title=Removed Relationship::{rel_change.key}{cardinality_info}"
-            )
-        elif rel_change.change_type == "modified":
-            modified_fields_str = ", ".join(rel_change.modified_fields.keys())
-            lines.append(
-                f"::notice title=Modified Relationship::{rel_change.key} ({modified_fields_str})"
-            )
-
-    return "\n".join(lines)
+    sections: tuple[tuple[str, list[Any]], ...] = (
+        ("domain", diff.domain_changes),
+        ("concept", diff.concept_changes),
+        ("relationship", diff.relationship_changes),
+    )
+    return "\n".join(
+        _GITHUB_FORMATTERS[section, change.change_type](change)
+        for section, changes in sections
+        for change in changes
+    )
 
 
 def format_json(diff: ConceptualDiff) -> str:
@@ -198,23 +221,15 @@ def format_json(diff: ConceptualDiff) -> str:
         }
 
         if change.old_value:
-            result["old_value"] = {
-                k: v
-                for k, v in change.old_value.__dict__.items()
-                if not k.startswith("_") and not callable(v)
-            }
+            result["old_value"] = change.old_value.to_dict()
 
         if change.new_value:
-            result["new_value"] = {
-                k: v
-                for k, v in change.new_value.__dict__.items()
-                if not k.startswith("_") and not callable(v)
-            }
+            result["new_value"] = change.new_value.to_dict()
 
         if change.modified_fields:
             result["modified_fields"] = {
                 field: {"old": old, "new": new}
-                for field, (old, new) in change.modified_fields.items()
+                for field, old, new in change.modified_fields
             }
 
         return result
@@ -228,7 +243,58 @@ def format_json(diff: ConceptualDiff) -> str:
         ],
     }
 
-    return json.dumps(output, indent=2)
+    return dumps_json(output)
+
+
+def _markdown_domain_added(change: Any) -> str:
+    return f"| ➕ | `{change.key}` | {change.new_value.display_name} |"
+
+
+def _markdown_domain_removed(change: Any) -> str:
+    return f"| ➖ | `{change.key}` | {change.old_value.display_name} |"
+
+
+def _markdown_concept_added(change: Any) -> str:
+    concept = change.new_value
+    domain_info = f"domain: {concept.domain}" if concept.domain else "no domain"
+    return f"| ➕ | `{change.key}` | {domain_info}, status: {concept.status} |"
+
+
+def _markdown_concept_removed(change: Any) -> str:
+    concept = change.old_value
+    domain_info = f"domain: {concept.domain}" if concept.domain else "no domain"
+    return f"| ➖ | `{change.key}` | {domain_info} |"
+
+
+# v1.0: relationships don't have a status property
+def _markdown_relationship_added(change: Any) -> str:
+    rel = change.new_value
+    cardinality_info = f"cardinality: {rel.cardinality}" if rel.cardinality else ""
+    return f"| ➕ | `{change.key}` | {cardinality_info} |"
+
+
+def _markdown_relationship_removed(change: Any) -> str:
+    rel = change.old_value
+    cardinality_info = f"cardinality: {rel.cardinality}" if rel.cardinality else ""
+    return f"| ➖ | `{change.key}` | {cardinality_info} |"
+
+
+def _markdown_modified(change: Any) -> str:
+    return f"| ✏️ | `{change.key}` | modified: {_field_names(change)} |"
+
+
+# Table rows for format_markdown, keyed by (section, change type)
+_MARKDOWN_FORMATTERS: dict[tuple[str, ChangeType], Callable[[Any], str]] = {
+    ("domain", ChangeType.ADDED): _markdown_domain_added,
+    ("domain", ChangeType.REMOVED): _markdown_domain_removed,
+    ("domain", ChangeType.MODIFIED): _markdown_modified,
+    ("concept", ChangeType.ADDED): _markdown_concept_added,
+    ("concept", ChangeType.REMOVED): _markdown_concept_removed,
+    ("concept", ChangeType.MODIFIED): _markdown_modified,
+    ("relationship", ChangeType.ADDED): _markdown_relationship_added,
+    ("relationship", ChangeType.REMOVED): _markdown_relationship_removed,
+    ("relationship", ChangeType.MODIFIED): _markdown_modified,
+}
 
 
 def format_markdown(diff: ConceptualDiff) -> str:
@@ -246,27 +312,12 @@ def format_markdown(diff: ConceptualDiff) -> str:
     lines = ["## 📊 Conceptual Model Changes\n"]
 
     # Summary table
-    added = sum(
-        1
-        for c in (
-            diff.domain_changes + diff.concept_changes + diff.relationship_changes
-        )
-        if c.change_type == "added"
-    )
-    modified = sum(
-        1
-        for c in (
-            diff.domain_changes + diff.concept_changes + diff.relationship_changes
-        )
-        if c.change_type == "modified"
-    )
-    removed = sum(
-        1
-        for c in (
-            diff.domain_changes + diff.concept_changes + diff.relationship_changes
-        )
-        if c.change_type == "removed"
-    )
+    counts: Counter[ChangeType] = Counter()
+    for section_counts in diff.counts.values():
+        counts.update(section_counts)
+    added = counts[ChangeType.ADDED]
+    modified = counts[ChangeType.MODIFIED]
+    removed = counts[ChangeType.REMOVED]
 
     lines.append("| | Count |")
     lines.append("|---|-----|")
@@ -278,65 +329,19 @@ def format_markdown(diff: ConceptualDiff) -> str:
         lines.append(f"| ➖ Removed | {removed} |")
     lines.append("")
 
-    # Domain changes
-    if diff.domain_changes:
-        lines.append("### Domains\n")
-        lines.append("| Change | Name | Detail |")
-        lines.append("|--------|------|--------|")
-        for domain_change in diff.domain_changes:
-            if domain_change.change_type == "added":
-                name = domain_change.key
-                display = domain_change.new_value.display_name  # type: ignore
-                lines.append(f"| ➕ | `{name}` | {display} |")
-            elif domain_change.change_type == "removed":
-                name = domain_change.key
-                display = domain_change.old_value.display_name  # type: ignore
-                lines.append(f"| ➖ | `{name}` | {display} |")
-            elif domain_change.change_type == "modified":
-                name = domain_change.key
-                fields = ", ".join(domain_change.modified_fields.keys())
-                lines.append(f"| ✏️ | `{name}` | modified: {fields} |")
-        lines.append("")
-
-    # Concept changes
-    if diff.concept_changes:
-        lines.append("### Concepts\n")
-        lines.append("| Change | Name | Detail |")
-        lines.append("|--------|------|--------|")
-        for concept_change in diff.concept_changes:
-            if concept_change.change_type == "added":
-                concept = concept_change.new_value
-                domain_info = f"domain: {concept.domain}" if concept.domain else "no domain"  # type: ignore
-                status_info = f"status: {concept.status}"  # type: ignore
-                lines.append(
-                    f"| ➕ | `{concept_change.key}` | {domain_info}, {status_info} |"
-                )
-            elif concept_change.change_type == "removed":
-                concept = concept_change.old_value
-                domain_info = f"domain: {concept.domain}" if concept.domain else "no domain"  # type: ignore
-                lines.append(f"| ➖ | `{concept_change.key}` | {domain_info} |")
-            elif concept_change.change_type == "modified":
-                fields = ", ".join(concept_change.modified_fields.keys())
-                lines.append(f"| ✏️ | `{concept_change.key}` | modified: {fields} |")
-        lines.append("")
-
-    # Relationship changes (v1.0: relationships don't have a status property)
-    if diff.relationship_changes:
-        lines.append("### Relationships\n")
+    sections: tuple[tuple[str, str, list[Any]], ...] = (
+        ("### Domains\n", "domain", diff.domain_changes),
+        ("### Concepts\n", "concept", diff.concept_changes),
+        ("### Relationships\n", "relationship", diff.relationship_changes),
+    )
+    for title, section, changes in sections:
+        if not changes:
+            continue
+        lines.append(title)
         lines.append("| Change | Name | Detail |")
         lines.append("|--------|------|--------|")
-        for rel_change in diff.relationship_changes:
-            if rel_change.change_type == "added":
-                rel = rel_change.new_value
-                cardinality_info = f"cardinality: {rel.cardinality}" if rel.cardinality else ""  # type: ignore
-                lines.append(f"| ➕ | `{rel_change.key}` | {cardinality_info} |")
-            elif rel_change.change_type == "removed":
-                rel = rel_change.old_value
-                cardinality_info = f"cardinality: {rel.cardinality}" if rel.cardinality else ""  # type: ignore
-                lines.append(f"| ➖ | `{rel_change.key}` | {cardinality_info} |")
-            elif rel_change.change_type == "modified":
-                fields = ", ".join(rel_change.modified_fields.keys())
-                lines.append(f"| ✏️ | `{rel_change.key}` | modified: {fields} |")
+        for change in changes:
+            lines.append(_MARKDOWN_FORMATTERS[section, change.change_type](change))
         lines.append("")
 
     return "\n".join(lines)
@@ -2,58 +2,126 @@
 
 from __future__ import annotations
 
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any
 
 from .state import ConceptState, DomainState, ProjectState, RelationshipState
 
+# Slotted dataclasses need Python 3.10; on 3.9 instances keep a __dict__
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# (field, old value, new value) for each modified field
+FieldChanges = tuple[tuple[str, Any, Any], ...]
+
+# Fields compared between model versions (derived runtime fields excluded)
+_CONCEPT_FIELDS = ("name", "domain", "owner", "definition", "color")
+_RELATIONSHIP_FIELDS = (
+    "verb",
+    "from_concept",
+    "to_concept",
+    "cardinality",
+    "definition",
+    "owner",
+)
+_DOMAIN_FIELDS = ("name", "display_name", "color")
+
+
+class ChangeType(str, Enum):
+    """Kind of change to a concept, relationship or domain."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    MODIFIED = "modified"
+
+
+def _as_field_changes(
+    modified_fields: FieldChanges | dict[str, tuple[Any, Any]],
+) -> FieldChanges:
+    """Convert a {field: (old, new)} dict to field change triples."""
+    if isinstance(modified_fields, dict):
+        return tuple((name, old, new) for name, (old, new) in modified_fields.items())
+    return modified_fields
+
+
+def _field_changes(old: Any, new: Any, attrs: tuple[str, ...]) -> FieldChanges:
+    """Collect (field, old, new) triples for the attributes that differ."""
+    changes = []
+    for attr in attrs:
+        old_val = getattr(old, attr)
+        new_val = getattr(new, attr)
+        if old_val != new_val:
+            changes.append((attr, old_val, new_val))
+    return tuple(changes)
+
+
+def _normalize_change(change: Any) -> None:
+    """Normalize the constructor arguments of a change dataclass.
+
+    Plain strings such as "added" and {field: (old, new)} dicts are
+    accepted and converted to ChangeType and field change triples.
+    """
+    change.change_type = ChangeType(change.change_type)
+    change.modified_fields = _as_field_changes(change.modified_fields)
+
+
+@dataclass(**_SLOTS)
 class ConceptChange:
     """Represents a change to a concept."""
 
     key: str
-    change_type: str  # "added", "removed", "modified"
+    change_type: ChangeType
     old_value: ConceptState | None = None
     new_value: ConceptState | None = None
-    modified_fields: dict[str, tuple[Any, Any]] = field(
-        default_factory=dict
-    )  # field -> (old, new)
+    modified_fields: FieldChanges = ()
+
+    def __post_init__(self) -> None:
+        _normalize_change(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RelationshipChange:
     """Represents a change to a relationship."""
 
     key: str
-    change_type: str  # "added", "removed", "modified"
+    change_type: ChangeType
     old_value: RelationshipState | None = None
     new_value: RelationshipState | None = None
-    modified_fields: dict[str, tuple[Any, Any]] = field(
-        default_factory=dict
-    )  # field -> (old, new)
+    modified_fields: FieldChanges = ()
 
+    def __post_init__(self) -> None:
+        _normalize_change(self)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class DomainChange:
     """Represents a change to a domain."""
 
     key: str
-    change_type: str  # "added", "removed", "modified"
+    change_type: ChangeType
     old_value: DomainState | None = None
     new_value: DomainState | None = None
-    modified_fields: dict[str, tuple[Any, Any]] = field(
-        default_factory=dict
-    )  # field -> (old, new)
+    modified_fields: FieldChanges = ()
+
+    def __post_init__(self) -> None:
+        _normalize_change(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConceptualDiff:
     """Represents all changes between two conceptual models."""
 
     concept_changes: list[ConceptChange] = field(default_factory=list)
     relationship_changes: list[RelationshipChange] = field(default_factory=list)
     domain_changes: list[DomainChange] = field(default_factory=list)
+    # Change types per section ('domain', 'concept', 'relationship'),
+    # counted once at construction; the change lists are not modified later
+    counts: dict[str, Counter[ChangeType]] = field(
+        init=False, repr=False, compare=False
+    )
 
     @property
     def has_changes(self) -> bool:
@@ -62,6 +130,13 @@ class ConceptualDiff:
             self.concept_changes or self.relationship_changes or self.domain_changes
         )
 
+    def __post_init__(self) -> None:
+        self.counts = {
+            "domain": Counter(c.change_type for c in self.domain_changes),
+            "concept": Counter(c.change_type for c in self.concept_changes),
+            "relationship": Counter(c.change_type for c in self.relationship_changes),
+        }
+
 
 def _compare_concepts(
     old: ConceptState | None, new: ConceptState | None, key: str
@@ -77,26 +152,21 @@ def _compare_concepts(
         ConceptChange if there are differences, None otherwise
     """
     if old is None and new is not None:
-        return ConceptChange(key=key, change_type="added", new_value=new)
+        return ConceptChange(key=key, change_type=ChangeType.ADDED, new_value=new)
     if old is not None and new is None:
-        return ConceptChange(key=key, change_type="removed", old_value=old)
+        return ConceptChange(key=key, change_type=ChangeType.REMOVED, old_value=old)
 
     if old is None or new is None:
         return None
 
     # Compare fields that matter for conceptual model (exclude derived runtime fields)
     # v1.0: removed replaced_by
-    modified_fields = {}
-    for attr in ["name", "domain", "owner", "definition", "color"]:
-        old_val = getattr(old, attr)
-        new_val = getattr(new, attr)
-        if old_val != new_val:
-            modified_fields[attr] = (old_val, new_val)
+    modified_fields = _field_changes(old, new, _CONCEPT_FIELDS)
 
     if modified_fields:
         return ConceptChange(
             key=key,
-            change_type="modified",
+            change_type=ChangeType.MODIFIED,
             old_value=old,
             new_value=new,
             modified_fields=modified_fields,
@@ -119,33 +189,23 @@ def _compare_relationships(
         RelationshipChange if there are differences, None otherwise
     """
     if old is None and new is not None:
-        return RelationshipChange(key=key, change_type="added", new_value=new)
+        return RelationshipChange(key=key, change_type=ChangeType.ADDED, new_value=new)
     if old is not None and new is None:
-        return RelationshipChange(key=key, change_type="removed", old_value=old)
+        return RelationshipChange(
+            key=key, change_type=ChangeType.REMOVED, old_value=old
+        )
 
     if old is None or new is None:
         return None
 
     # Compare fields (exclude derived runtime fields)
     # v1.0: removed custom_name and domains
-    modified_fields = {}
-    for attr in [
-        "verb",
-        "from_concept",
-        "to_concept",
-        "cardinality",
-        "definition",
-        "owner",
-    ]:
-        old_val = getattr(old, attr)
-        new_val = getattr(new, attr)
-        if old_val != new_val:
-            modified_fields[attr] = (old_val, new_val)
+    modified_fields = _field_changes(old, new, _RELATIONSHIP_FIELDS)
 
     if modified_fields:
         return RelationshipChange(
             key=key,
-            change_type="modified",
+            change_type=ChangeType.MODIFIED,
             old_value=old,
             new_value=new,
             modified_fields=modified_fields,
@@ -168,25 +228,20 @@ def _compare_domains(
         DomainChange if there are differences, None otherwise
     """
     if old is None and new is not None:
-        return DomainChange(key=key, change_type="added", new_value=new)
+        return DomainChange(key=key, change_type=ChangeType.ADDED, new_value=new)
     if old is not None and new is None:
-        return DomainChange(key=key, change_type="removed", old_value=old)
+        return DomainChange(key=key, change_type=ChangeType.REMOVED, old_value=old)
 
     if old is None or new is None:
         return None
 
     # Compare fields
-    modified_fields = {}
-    for attr in ["name", "display_name", "color"]:
-        old_val = getattr(old, attr)
-        new_val = getattr(new, attr)
-        if old_val != new_val:
-            modified_fields[attr] = (old_val, new_val)
+    modified_fields = _field_changes(old, new, _DOMAIN_FIELDS)
 
     if modified_fields:
         return DomainChange(
             key=key,
-            change_type="modified",
+            change_type=ChangeType.MODIFIED,
             old_value=old,
             new_value=new,
             modified_fields=modified_fields,
@@ -205,7 +260,10 @@ def compute_diff(base: ProjectState, current: ProjectState) -> ConceptualDiff:
     Returns:
         ConceptualDiff containing all changes
     """
-    diff = ConceptualDiff()
+    # Collect every change first; ConceptualDiff counts them on construction
+    concept_changes: list[ConceptChange] = []
+    relationship_changes: list[RelationshipChange] = []
+    domain_changes: list[DomainChange] = []
 
     # Compare concepts
     all_concept_keys = set(base.concepts.keys()) | set(current.concepts.keys())
@@ -214,7 +272,7 @@ def compute_diff(base: ProjectState, current: ProjectState) -> ConceptualDiff:
         new_concept = current.concepts.get(key)
         concept_change = _compare_concepts(old_concept, new_concept, key)
         if concept_change:
-            diff.concept_changes.append(concept_change)
+            concept_changes.append(concept_change)
 
     # Compare relationships
     all_rel_keys = set(base.relationships.keys()) | set(current.relationships.keys())
@@ -223,7 +281,7 @@ def compute_diff(base: ProjectState, current: ProjectState) -> ConceptualDiff:
         new_rel = current.relationships.get(key)
         rel_change = _compare_relationships(old_rel, new_rel, key)
         if rel_change:
-            diff.relationship_changes.append(rel_change)
+            relationship_changes.append(rel_change)
 
     # Compare domains
     all_domain_keys = set(base.domains.keys()) | set(current.domains.keys())
@@ -232,6 +290,10 @@ def compute_diff(base: ProjectState, current: ProjectState) -> ConceptualDiff:
         new_domain = current.domains.get(key)
         domain_change = _compare_domains(old_domain, new_domain, key)
         if domain_change:
-            diff.domain_changes.append(domain_change)
+            domain_changes.append(domain_change)
 
-    return diff
+    return ConceptualDiff(
+        concept_changes=concept_changes,
+        relationship_changes=relationship_changes,
+        domain_changes=domain_changes,
+    )
@@ -3,6 +3,7 @@
 v1.0: Simplified model - single models[] array.
 """
 
+from collections import Counter
 from typing import TextIO
 
 from dbt_conceptual.state import ConceptState, ProjectState
@@ -17,13 +18,16 @@ def export_coverage(state: ProjectState, output: TextIO) -> None:
     """
     # Calculate statistics
     total_concepts = len(state.concepts)
-    complete_concepts = sum(
-        1 for c in state.concepts.values() if c.status == "complete"
-    )
-    stub_concepts = sum(1 for c in state.concepts.values() if c.status == "stub")
-    draft_concepts = sum(1 for c in state.concepts.values() if c.status == "draft")
-
-    concepts_with_models = sum(1 for c in state.concepts.values() if c.models)
+    # Tally statuses and model coverage in one pass over the concepts
+    status_counts: Counter[str] = Counter()
+    concepts_with_models = 0
+    for concept in state.concepts.values():
+        status_counts[concept.status] += 1
+        if concept.models:
+            concepts_with_models += 1
+    complete_concepts = status_counts["complete"]
+    stub_concepts = status_counts["stub"]
+    draft_concepts = status_counts["draft"]
 
     total_relationships = len(state.relationships)
     complete_relationships = sum(
@@ -5,23 +5,44 @@ Provides JSON and markdown exporters for various report types.
 v1.0: Simplified model - single models[] array, no realized_by.
 """
 
-import json
-from typing import Any, TextIO
+import io
+from collections import Counter
+from typing import Any, BinaryIO, TextIO, Union, cast
 
+from dbt_conceptual.serialization import dumps_json, dumps_json_bytes
 from dbt_conceptual.state import ProjectState
 from dbt_conceptual.validator import ValidationIssue, Validator
 
+# Markdown status icons per concept status
+_STATUS_ICONS = {"complete": "✅", "draft": "📝", "stub": "⚠️"}
+
+# JSON exporters write ASCII-only str to text streams and UTF-8 bytes to
+# binary ones
+JsonOutput = Union[TextIO, BinaryIO]
+
+
+def _write_json(output: JsonOutput, data: Any) -> None:
+    """Write data as JSON followed by a newline to a text or binary stream."""
+    # Raw streams too, e.g. FileIO from open(path, "wb", buffering=0)
+    if isinstance(output, (io.BufferedIOBase, io.RawIOBase)):
+        output.write(dumps_json_bytes(data) + b"\n")
+    else:
+        cast(TextIO, output).write(dumps_json(data) + "\n")
+
 
 def _calculate_coverage_stats(state: ProjectState) -> dict[str, Any]:
     """Calculate coverage statistics from project state."""
     total_concepts = len(state.concepts)
-    complete_concepts = sum(
-        1 for c in state.concepts.values() if c.status == "complete"
-    )
-    stub_concepts = sum(1 for c in state.concepts.values() if c.status == "stub")
-    draft_concepts = sum(1 for c in state.concepts.values() if c.status == "draft")
-
-    concepts_with_models = sum(1 for c in state.concepts.values() if c.models)
+    # Tally statuses and model coverage in one pass over the concepts
+    status_counts: Counter[str] = Counter()
+    concepts_with_models = 0
+    for concept in state.concepts.values():
+        status_counts[concept.status] += 1
+        if concept.models:
+            concepts_with_models += 1
+    complete_concepts = status_counts["complete"]
+    stub_concepts = status_counts["stub"]
+    draft_concepts = status_counts["draft"]
 
     total_relationships = len(state.relationships)
     complete_relationships = sum(
@@ -70,8 +91,8 @@ def _calculate_coverage_stats(state: ProjectState) -> dict[str, Any]:
 # ============================================================================
 
 
-def export_coverage_json(state: ProjectState, output: TextIO) -> None:
-    """Export coverage report as JSON."""
+def _build_coverage_dict(state: ProjectState) -> dict[str, Any]:
+    """Build the coverage report data written by export_coverage_json."""
     stats = _calculate_coverage_stats(state)
 
     # Add concept details
@@ -90,7 +111,7 @@ def export_coverage_json(state: ProjectState, output: TextIO) -> None:
             }
         )
 
-    data = {
+    return {
         "summary": stats,
         "concepts_by_domain": concepts_by_domain,
         "domains": {
@@ -103,43 +124,50 @@ def export_coverage_json(state: ProjectState, output: TextIO) -> None:
         },
     }
 
-    json.dump(data, output, indent=2)
-    output.write("\n")
+
+def export_coverage_json(state: ProjectState, output: JsonOutput) -> None:
+    """Export coverage report as JSON."""
+    _write_json(output, _build_coverage_dict(state))
 
 
 def export_coverage_markdown(state: ProjectState, output: TextIO) -> None:
     """Export coverage report as markdown."""
+    parts: list[str] = []
+    write = parts.append
+
     stats = _calculate_coverage_stats(state)
 
-    output.write("### Coverage Summary\n\n")
-    output.write("| Metric | Value |\n")
-    output.write("|--------|-------|\n")
-    output.write(
+    write("### Coverage Summary\n\n")
+    write("| Metric | Value |\n")
+    write("|--------|-------|\n")
+    write(
         f"| Concept Completion | {stats['concepts']['completion_percent']}% "
         f"({stats['concepts']['complete']}/{stats['concepts']['total']}) |\n"
     )
-    output.write(
+    write(
         f"| Model Coverage | {stats['coverage']['models']['percent']}% "
         f"({stats['coverage']['models']['count']} concepts) |\n"
     )
-    output.write(
+    write(
         f"| Relationships Complete | {stats['relationships']['percent']}% "
         f"({stats['relationships']['complete']}/{stats['relationships']['total']}) |\n"
     )
     if stats["orphans"] > 0:
-        output.write(f"| Orphan Models | {stats['orphans']} |\n")
-    output.write("\n")
+        write(f"| Orphan Models | {stats['orphans']} |\n")
+    write("\n")
 
     # Concepts by status
     if stats["concepts"]["stub"] > 0 or stats["concepts"]["draft"] > 0:
-        output.write("#### Attention Needed\n\n")
+        write("#### Attention Needed\n\n")
         if stats["concepts"]["stub"] > 0:
-            output.write(f"- ⚠️ **{stats['concepts']['stub']} stub concepts** ")
-            output.write("need definitions and domain assignment\n")
+            write(f"- ⚠️ **{stats['concepts']['stub']} stub concepts** ")
+            write("need definitions and domain assignment\n")
         if stats["concepts"]["draft"] > 0:
-            output.write(f"- 📝 **{stats['concepts']['draft']} draft concepts** ")
-            output.write("have no model implementations yet\n")
-        output.write("\n")
+            write(f"- 📝 **{stats['concepts']['draft']} draft concepts** ")
+            write("have no model implementations yet\n")
+        write("\n")
+
+    output.write("".join(parts))
 
 
 # ============================================================================
@@ -147,7 +175,7 @@ def export_coverage_markdown(state: ProjectState, output: TextIO) -> None:
 # ============================================================================
 
 
-def export_bus_matrix_json(state: ProjectState, output: TextIO) -> None:
+def export_bus_matrix_json(state: ProjectState, output: JsonOutput) -> None:
     """Export bus matrix as JSON.
 
     Note: v1.0 removed realized_by from relationships, so this returns
@@ -175,8 +203,7 @@ def export_bus_matrix_json(state: ProjectState, output: TextIO) -> None:
         "note": "Bus matrix realization tracking coming in future version",
     }
 
-    json.dump(data, output, indent=2)
-    output.write("\n")
+    _write_json(output, data)
 
 
 def export_bus_matrix_markdown(state: ProjectState, output: TextIO) -> None:
@@ -185,36 +212,44 @@ def export_bus_matrix_markdown(state: ProjectState, output: TextIO) -> None:
     Note: v1.0 removed realized_by, so this shows relationships without
     realization info.
     """
+    parts: list[str] = []
+    write = parts.append
+
     relationships_list = sorted(
         state.relationships.items(), key=lambda x: (x[1].from_concept, x[1].name)
     )
 
-    output.write("### Bus Matrix\n\n")
+    write("### Bus Matrix\n\n")
 
     if not relationships_list:
-        output.write("*No relationships defined.*\n\n")
+        write("*No relationships defined.*\n\n")
+        output.write("".join(parts))
         return
 
-    output.write("| Relationship | From | To | Cardinality |\n")
-    output.write("|-------------|------|-----|-------------|\n")
+    write("| Relationship | From | To | Cardinality |\n")
+    write("|-------------|------|-----|-------------|\n")
 
-    for _rel_id, rel in relationships_list:
-        output.write(
+    write(
+        "".join(
             f"| {rel.verb} | {rel.from_concept} | {rel.to_concept} | {rel.cardinality} |\n"
+            for _rel_id, rel in relationships_list
         )
+    )
 
-    output.write("\n")
-    output.write(
+    write("\n")
+    write(
         "*Note: Relationship realization tracking will be added in a future version.*\n\n"
     )
 
+    output.write("".join(parts))
+
 
 # ============================================================================
 # Status Exporters
 # ============================================================================
 
 
-def export_status_json(state: ProjectState, output: TextIO) -> None:
+def export_status_json(state: ProjectState, output: JsonOutput) -> None:
     """Export status report as JSON."""
     stats = _calculate_coverage_stats(state)
 
@@ -249,22 +284,24 @@ def export_status_json(state: ProjectState, output: TextIO) -> None:
         "relationships": relationships_data,
     }
 
-    json.dump(data, output, indent=2)
-    output.write("\n")
+    _write_json(output, data)
 
 
 def export_status_markdown(state: ProjectState, output: TextIO) -> None:
     """Export status report as markdown."""
+    parts: list[str] = []
+    write = parts.append
+
     stats = _calculate_coverage_stats(state)
 
-    output.write("### Status Summary\n\n")
-    output.write(f"**Concepts:** {stats['concepts']['total']} total ")
-    output.write(f"({stats['concepts']['complete']} complete, ")
-    output.write(f"{stats['concepts']['draft']} draft, ")
-    output.write(f"{stats['concepts']['stub']} stub)\n\n")
+    write("### Status Summary\n\n")
+    write(f"**Concepts:** {stats['concepts']['total']} total ")
+    write(f"({stats['concepts']['complete']} complete, ")
+    write(f"{stats['concepts']['draft']} draft, ")
+    write(f"{stats['concepts']['stub']} stub)\n\n")
 
-    output.write(f"**Relationships:** {stats['relationships']['total']} total ")
-    output.write(f"({stats['relationships']['complete']} complete)\n\n")
+    write(f"**Relationships:** {stats['relationships']['total']} total ")
+    write(f"({stats['relationships']['complete']} complete)\n\n")
 
     # Group by domain
     domain_groups: dict[str, list[tuple[str, Any]]] = {}
@@ -274,7 +311,7 @@ def export_status_markdown(state: ProjectState, output: TextIO) -> None:
             domain_groups[domain] = []
         domain_groups[domain].append((concept_id, concept))
 
-    output.write("#### Concepts by Domain\n\n")
+    write("#### Concepts by Domain\n\n")
     for domain_id in sorted(domain_groups.keys()):
         concepts = domain_groups[domain_id]
         domain_name = domain_id
@@ -283,16 +320,20 @@ def export_status_markdown(state: ProjectState, output: TextIO) -> None:
                 state.domains[domain_id].display_name or state.domains[domain_id].name
             )
 
-        output.write(f"**{domain_name}** ({len(concepts)} concepts)\n\n")
-        output.write("| Concept | Status | Models |\n")
-        output.write("|---------|--------|--------|\n")
+        write(f"**{domain_name}** ({len(concepts)} concepts)\n\n")
+        write("| Concept | Status | Models |\n")
+        write("|---------|--------|--------|\n")
 
-        for _cid, c in sorted(concepts, key=lambda x: x[1].name):
-            status_icon = {"complete": "✅", "draft": "📝", "stub": "⚠️"}.get(
-                c.status, "❓"
+        write(
+            "".join(
+                f"| {c.name} | {_STATUS_ICONS.get(c.status, '❓')} {c.status} "
+                f"| {len(c.models)} |\n"
+                for _cid, c in sorted(concepts, key=lambda x: x[1].name)
             )
-            output.write(f"| {c.name} | {status_icon} {c.status} | {len(c.models)} |\n")
-        output.write("\n")
+        )
+        write("\n")
+
+    output.write("".join(parts))
 
 
 # ============================================================================
@@ -300,7 +341,7 @@ def export_status_markdown(state: ProjectState, output: TextIO) -> None:
 # ============================================================================
 
 
-def export_orphans_json(state: ProjectState, output: TextIO) -> None:
+def export_orphans_json(state: ProjectState, output: JsonOutput) -> None:
     """Export orphan models as JSON."""
     orphans_data = [
         {
@@ -316,30 +357,35 @@ def export_orphans_json(state: ProjectState, output: TextIO) -> None:
         "models": orphans_data,
     }
 
-    json.dump(data, output, indent=2)
-    output.write("\n")
+    _write_json(output, data)
 
 
 def export_orphans_markdown(state: ProjectState, output: TextIO) -> None:
     """Export orphan models as markdown."""
+    parts: list[str] = []
+    write = parts.append
+
     orphans = sorted(state.orphan_models, key=lambda o: o.name)
 
-    output.write("### Orphan Models\n\n")
+    write("### Orphan Models\n\n")
 
     if not orphans:
-        output.write("✅ **No orphan models found!**\n\n")
-        output.write("All models have `meta.concept` tags.\n\n")
+        write("✅ **No orphan models found!**\n\n")
+        write("All models have `meta.concept` tags.\n\n")
+        output.write("".join(parts))
         return
 
-    output.write(f"Found **{len(orphans)} models** without conceptual tags:\n\n")
-    output.write("| Model | Path |\n")
-    output.write("|-------|------|\n")
+    write(f"Found **{len(orphans)} models** without conceptual tags:\n\n")
+    write("| Model | Path |\n")
+    write("|-------|------|\n")
+
+    write(
+        "".join(f"| `{orphan.name}` | {orphan.path or '-'} |\n" for orphan in orphans)
+    )
 
-    for orphan in orphans:
-        path = orphan.path or "-"
-        output.write(f"| `{orphan.name}` | {path} |\n")
+    write("\n")
 
-    output.write("\n")
+    output.write("".join(parts))
 
 
 # ============================================================================
@@ -348,7 +394,7 @@ def export_orphans_markdown(state: ProjectState, output: TextIO) -> None:
 
 
 def export_validation_json(
-    validator: Validator, issues: list[ValidationIssue], output: TextIO
+    validator: Validator, issues: list[ValidationIssue], output: JsonOutput
 ) -> None:
     """Export validation results as JSON."""
     summary = validator.get_summary()
@@ -373,8 +419,7 @@ def export_validation_json(
         "issues": issues_data,
     }
 
-    json.dump(data, output, indent=2)
-    output.write("\n")
+    _write_json(output, data)
 
 
 def export_validation_markdown(
@@ -383,36 +428,41 @@ def export_validation_markdown(
     """Export validation results as markdown."""
     from dbt_conceptual.validator import Severity
 
+    parts: list[str] = []
+    write = parts.append
+
     summary = validator.get_summary()
 
     if validator.has_errors():
-        output.write("### ❌ Validation Failed\n\n")
+        write("### ❌ Validation Failed\n\n")
     else:
-        output.write("### ✅ Validation Passed\n\n")
+        write("### ✅ Validation Passed\n\n")
 
     # Summary table
-    output.write("| | Count |\n")
-    output.write("|---|-----|\n")
+    write("| | Count |\n")
+    write("|---|-----|\n")
     if summary["errors"]:
-        output.write(f"| 🔴 Errors | {summary['errors']} |\n")
+        write(f"| 🔴 Errors | {summary['errors']} |\n")
     if summary["warnings"]:
-        output.write(f"| 🟡 Warnings | {summary['warnings']} |\n")
+        write(f"| 🟡 Warnings | {summary['warnings']} |\n")
     if summary["info"]:
-        output.write(f"| ℹ️ Info | {summary['info']} |\n")
-    output.write("\n")
+        write(f"| ℹ️ Info | {summary['info']} |\n")
+    write("\n")
 
     # Group issues by severity
-    errors = [i for i in issues if i.severity == Severity.ERROR]
-    warnings = [i for i in issues if i.severity == Severity.WARNING]
+    errors = [i for i in issues if i.severity is Severity.ERROR]
+    warnings = [i for i in issues if i.severity is Severity.WARNING]
 
     if errors:
-        output.write("#### Errors\n\n")
+        write("#### Errors\n\n")
         for issue in errors:
-            output.write(f"- **{issue.code}** — {issue.message}\n")
-        output.write("\n")
+            write(f"- **{issue.code}** — {issue.message}\n")
+        write("\n")
 
     if warnings:
-        output.write("#### Warnings\n\n")
+        write("#### Warnings\n\n")
         for issue in warnings:
-            output.write(f"- **{issue.code}** — {issue.message}\n")
-        output.write("\n")
+            write(f"- **{issue.code}** — {issue.message}\n")
+        write("\n")
+
+    output.write("".join(parts))
@@ -6,7 +6,7 @@ Provides utilities for loading project state from git refs and computing diffs.
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import yaml
 
@@ -21,6 +21,9 @@ if TYPE_CHECKING:
     from dbt_conceptual.config import Config
     from dbt_conceptual.differ import ConceptualDiff
 
+# Runs a git command; called like subprocess.run, which is the default
+GitRunner = Callable[..., "subprocess.CompletedProcess[Any]"]
+
 
 class GitError(Exception):
     """Error during git operations."""
@@ -50,12 +53,15 @@ class RefNotFoundError(GitError):
         super().__init__(f"Could not find {file_path} at ref '{ref}'")
 
 
-def load_state_from_git_ref(config: "Config", base_ref: str) -> ProjectState:
+def load_state_from_git_ref(
+    config: "Config", base_ref: str, *, runner: Optional[GitRunner] = None
+) -> ProjectState:
     """Load ProjectState from a git ref.
 
     Args:
         config: Project configuration
         base_ref: Git ref to load from (e.g., 'main', 'origin/main', 'HEAD~1')
+        runner: Callable used instead of subprocess.run to invoke git
 
     Returns:
         ProjectState loaded from the git ref
@@ -66,10 +72,11 @@ def load_state_from_git_ref(config: "Config", base_ref: str) -> ProjectState:
         RefNotFoundError: If the ref or file doesn't exist
     """
     project_dir = config.project_dir
+    run = runner or subprocess.run
 
     # Check if we're in a git repo
     try:
-        subprocess.run(
+        run(
             ["git", "rev-parse", "--git-dir"],
             cwd=project_dir,
             check=True,
@@ -82,7 +89,7 @@ def load_state_from_git_ref(config: "Config", base_ref: str) -> ProjectState:
 
     # Get the conceptual.yml content from base ref
     conceptual_rel_path = config.conceptual_file.relative_to(project_dir)
-    result = subprocess.run(
+    result = run(
         ["git", "show", f"{base_ref}:{conceptual_rel_path}"],
         cwd=project_dir,
         capture_output=True,
@@ -149,12 +156,15 @@ def load_state_from_git_ref(config: "Config", base_ref: str) -> ProjectState:
         temp_path.unlink()
 
 
-def compute_diff_from_ref(config: "Config", base_ref: str) -> "ConceptualDiff":
+def compute_diff_from_ref(
+    config: "Config", base_ref: str, *, runner: Optional[GitRunner] = None
+) -> "ConceptualDiff":
     """Compute diff between current state and base git ref.
 
     Args:
         config: Project configuration
         base_ref: Base git ref to compare against
+        runner: Callable used instead of subprocess.run to invoke git
 
     Returns:
         ConceptualDiff object with changes
@@ -172,7 +182,7 @@ def compute_diff_from_ref(config: "Config", base_ref: str) -> "ConceptualDiff":
     current_state = builder.build()
 
     # Load base state from git ref
-    base_state = load_state_from_git_ref(config, base_ref)
+    base_state = load_state_from_git_ref(config, base_ref, runner=runner)
 
     # Compute and return diff
     return compute_diff(base_state, current_state)
@@ -3,11 +3,10 @@
 v1.0: Simplified parser with flat model lists and no lineage inference.
 """
 
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
 
-import yaml
-
-from dbt_conceptual.config import Config
+from dbt_conceptual.config import Config, load_conceptual_data
 from dbt_conceptual.scanner import DbtProjectScanner
 from dbt_conceptual.state import (
     ConceptState,
@@ -38,14 +37,18 @@ class ConceptualModelParser:
         Returns:
             ProjectState with concepts, relationships, and domains
         """
-        state = ProjectState()
+        return self.parse_mapping(load_conceptual_data(self.config.conceptual_file))
 
-        conceptual_file = self.config.conceptual_file
-        if not conceptual_file.exists():
-            return state
+    def parse_mapping(self, data: Any) -> ProjectState:
+        """Build initial state from already parsed conceptual.yml contents.
 
-        with open(conceptual_file) as f:
-            data = yaml.safe_load(f)
+        Args:
+            data: Parsed conceptual.yml document (None for a missing file)
+
+        Returns:
+            ProjectState with concepts, relationships, and domains
+        """
+        state = ProjectState()
 
         if not data:
             return state
@@ -119,17 +122,42 @@ class StateBuilder:
         self.parser = ConceptualModelParser(config)
         self.scanner = DbtProjectScanner(config)
 
-    def build(self) -> ProjectState:
+    def build(self, schema_files: Optional[list[Path]] = None) -> ProjectState:
         """Build complete project state from conceptual model and dbt models.
 
+        Args:
+            schema_files: Schema files already collected by the scanner, if any
+
         Returns:
             Complete ProjectState with all linkages
         """
-        # Start with conceptual model
-        state = self.parser.parse()
+        return self._add_models(self.parser.parse(), schema_files)
+
+    def build_from_mapping(self, data: Any) -> ProjectState:
+        """Build complete project state from already parsed conceptual.yml contents.
 
+        Args:
+            data: Parsed conceptual.yml document (None for a missing file)
+
+        Returns:
+            Complete ProjectState with all linkages
+        """
+        return self._add_models(self.parser.parse_mapping(data))
+
+    def _add_models(
+        self, state: ProjectState, schema_files: Optional[list[Path]] = None
+    ) -> ProjectState:
+        """Link scanned dbt models into a parsed conceptual model state.
+
+        Args:
+            state: State parsed from conceptual.yml (modified in place)
+            schema_files: Schema files already collected by the scanner, if any
+
+        Returns:
+            The same state with models, orphans and linkages added
+        """
         # Scan dbt models (gold layer only)
-        models = self.scanner.scan()
+        models = self.scanner.scan(schema_files)
 
         # Process each model
         for model in models:
@@ -166,10 +194,13 @@ class StateBuilder:
             # Standard format: tags like "domain:party", "owner:team"
             for tag in tags:
                 if isinstance(tag, str):
-                    if tag.startswith("domain:"):
-                        domain_tags.append(tag[7:])  # Strip "domain:" prefix
-                    elif tag.startswith("owner:"):
-                        owner_tag = tag[6:]  # Strip "owner:" prefix
+                    key, sep, value = tag.partition(":")
+                    if not sep:
+                        continue
+                    if key == "domain":
+                        domain_tags.append(value)
+                    elif key == "owner":
+                        owner_tag = value
 
             # Databricks format: databricks_tags dict
             if databricks_tags:
@@ -5,15 +5,65 @@ v1.0: Only scans gold layer paths for models.
 
 import fnmatch
 import logging
+import os
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
 from dbt_conceptual.config import Config
+from dbt_conceptual.serialization import SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on reader threads used when scanning many schema files
+MAX_SCAN_WORKERS = 32
+
+
+def _collect_yaml_files(root: Path, yml: list[Path], yaml_files: list[Path]) -> None:
+    """Append .yml and .yaml files under a directory, in Path.rglob order.
+
+    Each directory's own files come before those of its subdirectories.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith(".yml"):
+            yml.append(Path(entry.path))
+        elif entry.name.endswith(".yaml"):
+            yaml_files.append(Path(entry.path))
+    for subdir in subdirs:
+        _collect_yaml_files(Path(subdir), yml, yaml_files)
+
+
+def _iter_yaml_files(root: Path) -> Iterator[Path]:
+    """Recursively yield YAML files under a directory in a single walk.
+
+    Uses os.scandir so directory entries carry their type and no extra
+    stat call is needed per entry. Symlinked directories are not followed,
+    matching Path.rglob. All .yml files come before any .yaml file, as
+    with rglob("*.yml") followed by rglob("*.yaml"), because this order
+    feeds concept.models and orphan_models.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Path objects for each .yml or .yaml file
+    """
+    yml: list[Path] = []
+    yaml_files: list[Path] = []
+    _collect_yaml_files(root, yml, yaml_files)
+    yield from yml
+    yield from yaml_files
+
 
 class DbtProjectScanner:
     """Scans a dbt project for model files in gold layer paths."""
@@ -46,8 +96,7 @@ class DbtProjectScanner:
                     yield full_path
                 elif full_path.is_dir():
                     # Find all .yml and .yaml files in directory
-                    yield from full_path.rglob("*.yml")
-                    yield from full_path.rglob("*.yaml")
+                    yield from _iter_yaml_files(full_path)
 
     def load_schema_file(self, schema_file: Path) -> dict:
         """Load and parse a schema YAML file.
@@ -59,7 +108,7 @@ class DbtProjectScanner:
             Parsed YAML content as a dictionary
         """
         with open(schema_file) as f:
-            content = yaml.safe_load(f)
+            content = yaml.load(f, Loader=SafeLoader)
             return content or {}
 
     def extract_models_from_schema(
@@ -120,13 +169,13 @@ class DbtProjectScanner:
 
         return models
 
-    def scan(self) -> list[dict]:
-        """Scan the dbt project for models in gold layer paths.
+    def collect_schema_files(self) -> list[Path]:
+        """List the schema files to scan, without duplicates.
 
         Returns:
-            List of all models found with their metadata
+            Schema file paths in discovery order
         """
-        all_models = []
+        schema_files = []
         seen_files: set[Path] = set()
 
         for schema_file in self.find_schema_files():
@@ -135,18 +184,58 @@ class DbtProjectScanner:
             if resolved in seen_files:
                 continue
             seen_files.add(resolved)
+            schema_files.append(schema_file)
+
+        return schema_files
+
+    def scan(self, schema_files: Optional[list[Path]] = None) -> list[dict]:
+        """Scan the dbt project for models in gold layer paths.
+
+        Schema files are read and parsed on a thread pool so file IO overlaps;
+        results are collected in discovery order.
 
-            try:
-                schema_data = self.load_schema_file(schema_file)
-                models = self.extract_models_from_schema(schema_data, schema_file)
-                all_models.extend(models)
-            except yaml.YAMLError as e:
-                logger.warning("Failed to parse %s: %s", schema_file, e)
-            except Exception as e:
-                logger.warning("Error processing %s: %s", schema_file, e)
+        Args:
+            schema_files: Files from collect_schema_files(), to skip walking
+                the gold layer paths again
 
+        Returns:
+            List of all models found with their metadata
+        """
+        if schema_files is None:
+            schema_files = self.collect_schema_files()
+
+        if len(schema_files) < 2:
+            results = [self._scan_file(schema_file) for schema_file in schema_files]
+        else:
+            workers = min(
+                MAX_SCAN_WORKERS, (os.cpu_count() or 1) * 4, len(schema_files)
+            )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._scan_file, schema_files))
+
+        all_models = []
+        for models in results:
+            all_models.extend(models)
         return all_models
 
+    def _scan_file(self, schema_file: Path) -> list[dict]:
+        """Load a single schema file and extract its models.
+
+        Args:
+            schema_file: Path to the schema file
+
+        Returns:
+            Models found in the file, or an empty list if it could not be read
+        """
+        try:
+            schema_data = self.load_schema_file(schema_file)
+            return self.extract_models_from_schema(schema_data, schema_file)
+        except yaml.YAMLError as e:
+            logger.warning("Failed to parse %s: %s", schema_file, e)
+        except Exception as e:
+            logger.warning("Error processing %s: %s", schema_file, e)
+        return []
+
     def _matches_gold_paths(self, path: str) -> bool:
         """Check if a path matches any gold layer pattern.
 
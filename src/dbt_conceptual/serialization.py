@@ -0,0 +1,86 @@
+"""Serialization helpers shared by the CLI and web server."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the libyaml-backed implementations when PyYAML was built with them
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    """Render one non-ASCII character as a JSON \\u escape, like json.dumps."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        # Characters outside the BMP become a UTF-16 surrogate pair
+        code -= 0x10000
+        high, low = 0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF)
+        return f"\\u{high:04x}\\u{low:04x}"
+    return f"\\u{code:04x}"
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data as ASCII-only JSON indented by two spaces.
+
+    Non-ASCII characters are escaped, so the text can be written to any
+    text stream regardless of its encoding. Uses orjson when it is
+    installed and escapes its output to match the stdlib json text.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        # Non-string keys (e.g. integer ids from YAML) become strings, as in json
+        text = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        # orjson never escapes; non-ASCII can only occur inside strings
+        return text if text.isascii() else _NON_ASCII.sub(_escape_non_ascii, text)
+    return json.dumps(data, indent=2)
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """Serialize data as UTF-8 encoded JSON indented by two spaces.
+
+    Non-ASCII characters are written as UTF-8 rather than escaped; use it
+    for binary streams, where no text encoding can get in the way.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON text encoded as UTF-8
+    """
+    if orjson is not None:
+        # Non-string keys (e.g. integer ids from YAML) become strings, as in json
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def write_yaml(path: Path, data: Any) -> None:
+    """Write data to a YAML file with a single write call.
+
+    The document is rendered in memory first, so the emitter does not
+    issue one small write per token against the open file.
+
+    Args:
+        path: File to write
+        data: YAML-serializable data
+    """
+    text = yaml.dump(data, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
+    with open(path, "w") as f:
+        f.write(text)
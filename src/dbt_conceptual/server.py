@@ -3,18 +3,91 @@
 v1.0: Simplified API with flat models[], no realized_by.
 """
 
+import hashlib
 import json
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, TextIO, Union, cast
 
 import yaml
 from flask import Flask, Response, jsonify, request, send_from_directory
 
-from dbt_conceptual.config import Config
+from dbt_conceptual.config import Config, is_racy_mtime, load_conceptual_data
 from dbt_conceptual.exporter.bus_matrix import export_bus_matrix
 from dbt_conceptual.exporter.coverage import export_coverage
 from dbt_conceptual.parser import StateBuilder
 from dbt_conceptual.scanner import DbtProjectScanner
+from dbt_conceptual.serialization import write_yaml
+
+# Worker threads for the Waitress server
+WAITRESS_THREADS = 8
+
+# Hosts the debug server may bind to; its debugger runs arbitrary code
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+
+# API-only fields that are never written back to conceptual.yml
+_DOMAIN_SKIP_FIELDS = frozenset({"display_name"})
+_CONCEPT_SKIP_FIELDS = frozenset(
+    {
+        "status",  # Derived
+        "models",  # Derived from meta.concept
+        "isGhost",  # Validation field
+        "validationStatus",  # Validation field
+        "validationMessages",  # Validation field
+    }
+)
+_RELATIONSHIP_SKIP_FIELDS = frozenset(
+    {"name", "status", "validationStatus", "validationMessages"}
+)
+
+# API field names that differ from their YAML counterparts
+_RELATIONSHIP_YAML_KEYS = {"from_concept": "from", "to_concept": "to"}
+
+
+def _files_etag(paths: Iterable[Path]) -> Optional[str]:
+    """Build an ETag from the modification time and size of source files.
+
+    Args:
+        paths: Files the response is derived from
+
+    Returns:
+        Hex digest that changes whenever any of the files change, or None
+        while a file was modified too recently for its stat to be trusted
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            digest.update(f"{path}:-\n".encode())
+            continue
+        if is_racy_mtime(stat.st_mtime_ns):
+            return None
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _conditional(response: Response, etag: Optional[str]) -> Response:
+    """Tag a response with an ETag and require revalidation on reuse."""
+    if etag is not None:
+        response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+class _ChunkWriter:
+    """Write-only text stream that keeps chunks for a streamed response.
+
+    Exporters write many small fragments; handing the list straight to
+    Flask avoids joining them into one string before encoding.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.chunks.append(text)
+        return len(text)
 
 
 def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
@@ -50,6 +123,22 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     # Load config
     config = Config.load(project_dir=project_dir)
 
+    def state_version() -> tuple[Optional[str], list[Path]]:
+        """ETag over conceptual.yml, the layout file and the gold schema files.
+
+        Returns:
+            Tuple of (ETag or None, schema files to hand to StateBuilder.build)
+        """
+        schema_files = DbtProjectScanner(config).collect_schema_files()
+        etag = _files_etag([config.conceptual_file, config.layout_file, *schema_files])
+        return etag, schema_files
+
+    def not_modified(etag: Optional[str]) -> Optional[Response]:
+        """Return a 304 response if the client already has this version."""
+        if etag is not None and request.if_none_match.contains(etag):
+            return _conditional(Response(status=304), etag)
+        return None
+
     @app.route("/")
     def index() -> Union[str, Response]:
         """Serve the main UI page."""
@@ -83,8 +172,13 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def get_state() -> Any:
         """Get current conceptual model state as JSON."""
         try:
+            etag, schema_files = state_version()
+            cached = not_modified(etag)
+            if cached is not None:
+                return cached
+
             builder = StateBuilder(config)
-            state = builder.build()
+            state = builder.build(schema_files)
 
             # Check for integrity issues (relationships referencing missing concepts)
             missing_refs = []
@@ -149,7 +243,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
                 "hasIntegrityErrors": has_integrity_errors,
             }
 
-            return jsonify(response)
+            return _conditional(jsonify(response), etag)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -177,66 +271,50 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
 
             # Domains
             if data.get("domains"):
+                skip = _DOMAIN_SKIP_FIELDS
                 yaml_data["domains"] = {
                     domain_id: {
                         k: v
                         for k, v in domain.items()
-                        if v is not None and k not in ("display_name",)
+                        if v is not None and k not in skip
                     }
                     for domain_id, domain in data["domains"].items()
                 }
 
             # Concepts
             if data.get("concepts"):
-                yaml_data["concepts"] = {}
+                skip = _CONCEPT_SKIP_FIELDS
+                concepts_out: dict[str, Any] = {}
                 for concept_id, concept in data["concepts"].items():
                     # Skip ghost concepts that haven't been properly defined
-                    if concept.get("isGhost") and not concept.get("domain"):
+                    get = concept.get
+                    if get("isGhost") and not get("domain"):
                         continue
                     # Only save fields that belong in YAML (not derived fields)
-                    concept_dict = {
+                    concepts_out[concept_id] = {
                         k: v
                         for k, v in concept.items()
-                        if v is not None
-                        and k
-                        not in (
-                            "status",  # Derived
-                            "models",  # Derived from meta.concept
-                            "isGhost",  # Validation field
-                            "validationStatus",  # Validation field
-                            "validationMessages",  # Validation field
-                        )
+                        if v is not None and k not in skip
                     }
-                    yaml_data["concepts"][concept_id] = concept_dict
+                yaml_data["concepts"] = concepts_out
 
             # Relationships
             if data.get("relationships"):
-                yaml_data["relationships"] = []
-                for rel in data["relationships"].values():
-                    rel_dict = {}
-                    for k, v in rel.items():
-                        if v is None:
-                            continue
-                        # Skip derived and validation fields
-                        if k in (
-                            "name",
-                            "status",
-                            "validationStatus",
-                            "validationMessages",
-                        ):
-                            continue
-                        # Map API field names to YAML field names
-                        if k == "from_concept":
-                            rel_dict["from"] = v
-                        elif k == "to_concept":
-                            rel_dict["to"] = v
-                        else:
-                            rel_dict[k] = v
-                    yaml_data["relationships"].append(rel_dict)
+                skip = _RELATIONSHIP_SKIP_FIELDS
+                yaml_key = _RELATIONSHIP_YAML_KEYS.get
+                # Skip derived and validation fields, and map API field
+                # names to YAML field names
+                yaml_data["relationships"] = [
+                    {
+                        yaml_key(k, k): v
+                        for k, v in rel.items()
+                        if v is not None and k not in skip
+                    }
+                    for rel in data["relationships"].values()
+                ]
 
             # Write to file
-            with open(conceptual_file, "w") as f:
-                yaml.dump(yaml_data, f, sort_keys=False, default_flow_style=False)
+            write_yaml(conceptual_file, yaml_data)
 
             return jsonify({"success": True, "message": "Saved to conceptual.yml"})
 
@@ -247,15 +325,18 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def get_coverage() -> Any:
         """Get coverage report as HTML."""
         try:
-            from io import StringIO
+            etag, schema_files = state_version()
+            cached = not_modified(etag)
+            if cached is not None:
+                return cached
 
             builder = StateBuilder(config)
-            state = builder.build()
+            state = builder.build(schema_files)
 
-            output = StringIO()
-            export_coverage(state, output)
+            output = _ChunkWriter()
+            export_coverage(state, cast(TextIO, output))
 
-            return output.getvalue(), 200, {"Content-Type": "text/html"}
+            return _conditional(Response(output.chunks, mimetype="text/html"), etag)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -263,15 +344,18 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def get_bus_matrix() -> Any:
         """Get bus matrix as HTML."""
         try:
-            from io import StringIO
+            etag, schema_files = state_version()
+            cached = not_modified(etag)
+            if cached is not None:
+                return cached
 
             builder = StateBuilder(config)
-            state = builder.build()
+            state = builder.build(schema_files)
 
-            output = StringIO()
-            export_bus_matrix(state, output)
+            output = _ChunkWriter()
+            export_bus_matrix(state, cast(TextIO, output))
 
-            return output.getvalue(), 200, {"Content-Type": "text/html"}
+            return _conditional(Response(output.chunks, mimetype="text/html"), etag)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -280,13 +364,19 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
         """Get layout positions from conceptual_layout.json."""
         try:
             layout_file = config.layout_file
+            # Also tags the no-layout response; a missing file hashes too
+            etag = _files_etag([layout_file])
+            cached = not_modified(etag)
+            if cached is not None:
+                return cached
+
             if not layout_file.exists():
-                return jsonify({"positions": {}})
+                return _conditional(jsonify({"positions": {}}), etag)
 
             with open(layout_file) as f:
                 layout_data = json.load(f) or {}
 
-            return jsonify(layout_data.get("positions", {}))
+            return _conditional(jsonify(layout_data.get("positions", {})), etag)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -305,7 +395,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
 
             # Write to file
             with open(layout_file, "w") as f:
-                json.dump(layout_data, f, indent=2)
+                f.write(json.dumps(layout_data, indent=2))
 
             return jsonify({"success": True, "message": "Layout saved"})
         except Exception as e:
@@ -426,12 +516,11 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             domains_data: dict[str, Any] = {}
 
             if conceptual_file.exists():
-                with open(conceptual_file) as f:
-                    data = yaml.safe_load(f) or {}
-                    if "config" in data:
-                        config_data = data["config"]
-                    if "domains" in data:
-                        domains_data = data["domains"]
+                data = load_conceptual_data(conceptual_file) or {}
+                if data.get("config"):
+                    config_data = data["config"]
+                if data.get("domains"):
+                    domains_data = data["domains"]
 
             return jsonify(
                 {
@@ -474,13 +563,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
                 conceptual_data["config"]["validation"] = data["validation"]
 
             # Write back
-            with open(conceptual_file, "w") as f:
-                yaml.dump(
-                    conceptual_data,
-                    f,
-                    sort_keys=False,
-                    default_flow_style=False,
-                )
+            write_yaml(conceptual_file, conceptual_data)
 
             return jsonify({"success": True, "message": "Settings saved"})
         except Exception as e:
@@ -494,8 +577,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             if not conceptual_file.exists():
                 return jsonify({"error": "conceptual.yml not found"}), 404
 
-            with open(conceptual_file) as f:
-                data = yaml.safe_load(f) or {}
+            data = load_conceptual_data(conceptual_file) or {}
 
             return jsonify(data.get("config", {}))
         except Exception as e:
@@ -518,13 +600,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
 
             conceptual_data["config"] = data
 
-            with open(conceptual_file, "w") as f:
-                yaml.dump(
-                    conceptual_data,
-                    f,
-                    sort_keys=False,
-                    default_flow_style=False,
-                )
+            write_yaml(conceptual_file, conceptual_data)
 
             return jsonify({"success": True, "message": "Config saved"})
         except Exception as e:
@@ -543,6 +619,7 @@ def run_server(
     host: str = "127.0.0.1",
     port: int = 8050,
     demo_mode: bool = False,
+    debug: bool = False,
 ) -> None:
     """Run the web server using Waitress (production-ready WSGI server).
 
@@ -551,8 +628,23 @@ def run_server(
         host: Host to bind to (default: 127.0.0.1)
         port: Port to bind to (default: 8050)
         demo_mode: Whether running in demo mode (default: False)
+        debug: Use Flask's development server with the debugger, reloader
+            and CORS headers for the Vite dev server (default: False)
+
+    Raises:
+        ValueError: If debug is requested on a non-loopback host
     """
-    from waitress import serve
+    if debug and host not in LOOPBACK_HOSTS:
+        raise ValueError(
+            f"Refusing to run the debug server on non-loopback host '{host}'"
+        )
 
     app = create_app(project_dir, demo_mode=demo_mode)
-    serve(app, host=host, port=port)
+
+    if debug:
+        app.run(host=host, port=port, debug=True)
+        return
+
+    from waitress import serve
+
+    serve(app, host=host, port=port, threads=WAITRESS_THREADS)
@@ -7,8 +7,12 @@ Simplified v1.0 state model:
 - No lineage inference
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
+
+# Slotted dataclasses need Python 3.10; on 3.9 instances keep a __dict__
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # Validation types
 ValidationStatus = Literal["valid", "warning", "error"]
@@ -36,7 +40,7 @@ class ValidationState:
     info_count: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConceptState:
     """Represents the state of a concept.
 
@@ -60,6 +64,20 @@ class ConceptState:
     validation_status: ValidationStatus = "valid"
     validation_messages: list[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a flat dict; lists are shared, not copied."""
+        return {
+            "name": self.name,
+            "domain": self.domain,
+            "owner": self.owner,
+            "definition": self.definition,
+            "color": self.color,
+            "models": self.models,
+            "is_ghost": self.is_ghost,
+            "validation_status": self.validation_status,
+            "validation_messages": self.validation_messages,
+        }
+
     @property
     def status(self) -> Literal["stub", "draft", "complete"]:
         """Derive status from domain and model associations.
@@ -76,7 +94,7 @@ class ConceptState:
         return "complete"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RelationshipState:
     """Represents the state of a relationship between concepts.
 
@@ -96,6 +114,19 @@ class RelationshipState:
     validation_status: ValidationStatus = "valid"
     validation_messages: list[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a flat dict; lists are shared, not copied."""
+        return {
+            "verb": self.verb,
+            "from_concept": self.from_concept,
+            "to_concept": self.to_concept,
+            "cardinality": self.cardinality,
+            "definition": self.definition,
+            "owner": self.owner,
+            "validation_status": self.validation_status,
+            "validation_messages": self.validation_messages,
+        }
+
     @property
     def name(self) -> str:
         """Get the display name for this relationship.
@@ -129,7 +160,7 @@ class RelationshipState:
         return "complete"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DomainState:
     """Represents a domain grouping."""
 
@@ -138,6 +169,15 @@ class DomainState:
     color: Optional[str] = None
     owner: Optional[str] = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a flat dict."""
+        return {
+            "name": self.name,
+            "display_name": self.display_name,
+            "color": self.color,
+            "owner": self.owner,
+        }
+
 
 @dataclass
 class ModelInfo:
@@ -9,12 +9,59 @@ v1.0 Validation Rules:
 - I002: Stub relationship needs verb (info)
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
 from dbt_conceptual.config import Config, RuleSeverity
-from dbt_conceptual.state import ProjectState
+from dbt_conceptual.state import (
+    ConceptState,
+    OrphanModel,
+    ProjectState,
+    RelationshipState,
+)
+
+# Slotted dataclasses need Python 3.10; on 3.9 instances keep a __dict__
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Validation codes
+CODE_E002 = "E002"  # Relationship references undefined concept
+CODE_E201 = "E201"  # Stub/draft concept (--no-drafts)
+CODE_E202 = "E202"  # Stub relationship (--no-drafts)
+CODE_W001 = "W001"  # Unknown domain reference
+CODE_W101 = "W101"  # Orphan model
+CODE_W102 = "W102"  # Unimplemented concept
+CODE_W104 = "W104"  # Missing definition
+CODE_I001 = "I001"  # Stub/draft concept needs enrichment
+CODE_I002 = "I002"  # Stub relationship needs enrichment
+
+# Message templates, filled positionally with str.format
+_MSG_E002 = "Relationship '{}' references non-existent concept '{}'"
+_MSG_W001 = "Concept '{}' references unknown domain '{}'"
+_MSG_W101 = "Model '{}' is not linked to any concept"
+_MSG_W102 = "Concept '{}' has no implementing models"
+_MSG_W104_CONCEPT = "Concept '{}' is missing a definition"
+_MSG_W104_RELATIONSHIP = "Relationship '{}' is missing a definition"
+_MSG_STUB_CONCEPT = "{} concept '{}' needs enrichment: missing {}"
+_MSG_STUB_RELATIONSHIP = "Stub relationship '{}' needs enrichment: missing {}"
+_MSG_STUB_RELATIONSHIP_ENDPOINTS = (
+    "Stub relationship '{}' has stub/ghost endpoint concepts"
+)
+
+# Concept statuses that still need enrichment
+_STUB_OR_DRAFT = frozenset({"stub", "draft"})
+
+# Stub enrichment fields; bit i of a missing-field mask stands for field i.
+# Indexed by mask: (names, ", ".join(names)) for the fields that are empty.
+_STUB_FIELDS = ("domain", "owner", "definition")
+_MISSING_TABLE: tuple[tuple[tuple[str, ...], str], ...] = tuple(
+    (names, ", ".join(names))
+    for names in (
+        tuple(field for bit, field in enumerate(_STUB_FIELDS) if mask >> bit & 1)
+        for mask in range(1 << len(_STUB_FIELDS))
+    )
+)
 
 
 class Severity(Enum):
@@ -25,16 +72,63 @@ class Severity(Enum):
     INFO = "info"
 
 
+# get_summary() key for each severity, in report order
+_SUMMARY_KEYS = {
+    Severity.ERROR: "errors",
+    Severity.WARNING: "warnings",
+    Severity.INFO: "info",
+}
+
+_RULE_TO_SEVERITY = {
+    RuleSeverity.ERROR: Severity.ERROR,
+    RuleSeverity.WARN: Severity.WARNING,
+}
+
+
 def _rule_to_severity(rule: RuleSeverity) -> Optional[Severity]:
     """Convert RuleSeverity to Severity (returns None for IGNORE)."""
-    if rule == RuleSeverity.ERROR:
-        return Severity.ERROR
-    elif rule == RuleSeverity.WARN:
-        return Severity.WARNING
-    return None
+    return _RULE_TO_SEVERITY.get(rule)
+
+
+def _resolve_endpoints(
+    concepts: dict[str, ConceptState],
+    statuses: dict[str, str],
+    relationships: dict[str, RelationshipState],
+) -> dict[str, tuple[bool, bool, str]]:
+    """Resolve each relationship's endpoints against the concepts once.
+
+    Equivalent to RelationshipState.get_status(), reusing the already
+    derived concept statuses.
+
+    Args:
+        concepts: All concepts
+        statuses: Derived status per concept id
+        relationships: Relationships to resolve
+
+    Returns:
+        Mapping of relationship id to (from_exists, to_exists, status)
+    """
+    resolved: dict[str, tuple[bool, bool, str]] = {}
+    for rel_id, rel in relationships.items():
+        from_concept = concepts.get(rel.from_concept)
+        to_concept = concepts.get(rel.to_concept)
+        stub = False
+        for concept_id, concept in (
+            (rel.from_concept, from_concept),
+            (rel.to_concept, to_concept),
+        ):
+            if concept is None or concept.is_ghost or statuses[concept_id] == "stub":
+                stub = True
+                break
+        resolved[rel_id] = (
+            from_concept is not None,
+            to_concept is not None,
+            "stub" if stub else "complete",
+        )
+    return resolved
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ValidationIssue:
     """Represents a validation issue."""
 
@@ -47,6 +141,17 @@ class ValidationIssue:
 class Validator:
     """Validates conceptual model and dbt implementation correspondence."""
 
+    __slots__ = (
+        "config",
+        "state",
+        "no_drafts",
+        "_issues",
+        "_has_error",
+        "_orphan_severity",
+        "_unimplemented_severity",
+        "_missing_definition_severity",
+    )
+
     def __init__(self, config: Config, state: ProjectState, no_drafts: bool = False):
         """Initialize the validator.
 
@@ -58,7 +163,39 @@ class Validator:
         self.config = config
         self.state = state
         self.no_drafts = no_drafts
-        self.issues: list[ValidationIssue] = []
+        self.issues = []
+
+        # Configurable rule severities are fixed for a given config
+        validation = config.validation
+        self._orphan_severity = _rule_to_severity(
+            validation.get_severity("orphan_models", "gold")
+        )
+        self._unimplemented_severity = _rule_to_severity(
+            validation.get_severity("unimplemented_concepts", "gold")
+        )
+        self._missing_definition_severity = _rule_to_severity(
+            validation.get_severity("missing_definitions", "gold")
+        )
+
+    @property
+    def issues(self) -> list[ValidationIssue]:
+        """Issues found by the last validate() run.
+
+        Do not mutate the list in place: has_errors() is tracked as issues
+        are recorded. To replace the issues, assign a new list instead.
+        """
+        return self._issues
+
+    @issues.setter
+    def issues(self, issues: list[ValidationIssue]) -> None:
+        self._issues = issues
+        self._has_error = any(issue.severity is Severity.ERROR for issue in issues)
+
+    def _extend(self, issues: list[ValidationIssue]) -> None:
+        """Record a batch of issues produced by one validation pass."""
+        self._issues.extend(issues)
+        if not self._has_error:
+            self._has_error = any(issue.severity is Severity.ERROR for issue in issues)
 
     def validate(self) -> list[ValidationIssue]:
         """Run all validation checks.
@@ -68,213 +205,268 @@ class Validator:
         """
         self.issues = []
 
-        # Hardcoded as errors - unknown refs are always errors
-        self._validate_relationship_endpoints()
+        for batch in self._run_passes():
+            self._extend(batch)
 
-        # Configurable rules
-        self._validate_orphan_models()
-        self._validate_unimplemented_concepts()
-        self._validate_missing_definitions()
+        return self._issues
+
+    def _run_passes(self) -> tuple[list[ValidationIssue], ...]:
+        """Run the validation passes over the project state.
 
-        # Always run - domain references
-        self._validate_domain_references()
+        Returns:
+            Per-rule issue batches in the established report order
+        """
+        # Bind state collections once and hand them to each check
+        state = self.state
+        concepts = state.concepts
+        relationships = state.relationships
+        domain_ids = frozenset(state.domains)
+
+        # Derived concept status column, computed once per concept
+        statuses: dict[str, str] = {
+            concept_id: concept.status for concept_id, concept in concepts.items()
+        }
 
-        # Info/stub checks
-        self._check_stub_concepts()
+        # Endpoint existence and derived status, resolved once per relationship
+        resolved = _resolve_endpoints(concepts, statuses, relationships)
+
+        # Each pass returns its own lists and skips work with nothing to check.
+        # Hardcoded as errors - unknown refs are always errors
+        endpoints = self._validate_relationship_endpoints(relationships, resolved)
+        # Configurable rules
+        orphans = self._validate_orphan_models(state.orphan_models)
+        # Concept and relationship checks each run in one fused pass
+        unimplemented, concept_definitions, unknown_domains, stub_concepts = (
+            self._validate_concepts(concepts, statuses, domain_ids)
+        )
+        relationship_definitions, stub_relationships = self._validate_relationships(
+            relationships, resolved
+        )
 
-        return self.issues
+        return (
+            endpoints,
+            orphans,
+            unimplemented,
+            concept_definitions,
+            relationship_definitions,
+            unknown_domains,
+            stub_concepts,
+            stub_relationships,
+        )
 
-    def _validate_relationship_endpoints(self) -> None:
+    def _validate_relationship_endpoints(
+        self,
+        relationships: dict[str, RelationshipState],
+        resolved: dict[str, tuple[bool, bool, str]],
+    ) -> list[ValidationIssue]:
         """Validate that relationship endpoints reference existing concepts.
 
         E002: Always an error - creates ghost concepts.
-        """
-        for rel_id, rel in self.state.relationships.items():
-            if rel.from_concept not in self.state.concepts:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        code="E002",
-                        message=f"Relationship '{rel_id}' references non-existent concept '{rel.from_concept}'",
-                        context={
-                            "relationship": rel_id,
-                            "missing_concept": rel.from_concept,
-                        },
-                    )
-                )
 
-            if rel.to_concept not in self.state.concepts:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        code="E002",
-                        message=f"Relationship '{rel_id}' references non-existent concept '{rel.to_concept}'",
-                        context={
-                            "relationship": rel_id,
-                            "missing_concept": rel.to_concept,
-                        },
+        Returns:
+            E002 issues in relationship order
+        """
+        out: list[ValidationIssue] = []
+        append = out.append
+        for rel_id, rel in relationships.items():
+            from_exists, to_exists, _ = resolved[rel_id]
+            if from_exists and to_exists:
+                continue
+            for endpoint, exists in (
+                (rel.from_concept, from_exists),
+                (rel.to_concept, to_exists),
+            ):
+                if not exists:
+                    append(
+                        ValidationIssue(
+                            severity=Severity.ERROR,
+                            code=CODE_E002,
+                            message=_MSG_E002.format(rel_id, endpoint),
+                            context={
+                                "relationship": rel_id,
+                                "missing_concept": endpoint,
+                            },
+                        )
                     )
-                )
+        return out
 
-    def _validate_orphan_models(self) -> None:
+    def _validate_orphan_models(
+        self, orphan_models: list[OrphanModel]
+    ) -> list[ValidationIssue]:
         """Check for models not linked to any concept.
 
         W101: Configurable severity.
+
+        Returns:
+            W101 issues in orphan order
         """
-        severity = _rule_to_severity(
-            self.config.validation.get_severity("orphan_models", "gold")
-        )
-        if severity is None:
-            return
+        severity = self._orphan_severity
+        if severity is None or not orphan_models:
+            return []
+
+        return [
+            ValidationIssue(
+                severity=severity,
+                code=CODE_W101,
+                message=_MSG_W101.format(orphan.name),
+                context={"model": orphan.name, "path": orphan.path},
+            )
+            for orphan in orphan_models
+        ]
+
+    def _validate_concepts(
+        self,
+        concepts: dict[str, ConceptState],
+        statuses: dict[str, str],
+        domain_ids: frozenset[str],
+    ) -> tuple[
+        list[ValidationIssue],
+        list[ValidationIssue],
+        list[ValidationIssue],
+        list[ValidationIssue],
+    ]:
+        """Run every per-concept check in a single pass over the concepts.
+
+        W102: Unimplemented concept (configurable severity)
+        W104: Concept missing a definition (configurable severity)
+        W001: Concept references an unknown domain (warning)
+        I001: Stub/draft concept needs enrichment (E201 with --no-drafts)
 
-        if self.state.orphan_models:
-            for orphan in self.state.orphan_models:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=severity,
-                        code="W101",
-                        message=f"Model '{orphan.name}' is not linked to any concept",
-                        context={"model": orphan.name, "path": orphan.path},
-                    )
-                )
+        Returns:
+            Tuple of (W102, W104, W001, I001/E201) issues, each in concept order
+        """
+        if not concepts:
+            return [], [], [], []
 
-    def _validate_unimplemented_concepts(self) -> None:
-        """Check for concepts with no implementing models.
+        unimplemented_severity = self._unimplemented_severity
+        missing_definition_severity = self._missing_definition_severity
+        stub_severity = Severity.ERROR if self.no_drafts else Severity.INFO
+        stub_code = CODE_E201 if self.no_drafts else CODE_I001
 
-        W102: Configurable severity.
-        """
-        severity = _rule_to_severity(
-            self.config.validation.get_severity("unimplemented_concepts", "gold")
-        )
-        if severity is None:
-            return
+        unimplemented: list[ValidationIssue] = []
+        missing_definitions: list[ValidationIssue] = []
+        unknown_domains: list[ValidationIssue] = []
+        stubs: list[ValidationIssue] = []
 
-        for concept_id, concept in self.state.concepts.items():
-            if concept.is_ghost:
-                continue  # Ghosts are already errors
+        for concept_id, concept in concepts.items():
+            domain = concept.domain
 
-            if not concept.models:
-                self.issues.append(
+            # Domain references are checked for ghosts too
+            if domain and domain not in domain_ids:
+                unknown_domains.append(
                     ValidationIssue(
-                        severity=severity,
-                        code="W102",
-                        message=f"Concept '{concept_id}' has no implementing models",
-                        context={"concept": concept_id, "status": concept.status},
+                        severity=Severity.WARNING,
+                        code=CODE_W001,
+                        message=_MSG_W001.format(concept_id, domain),
+                        context={"concept": concept_id, "domain": domain},
                     )
                 )
 
-    def _validate_missing_definitions(self) -> None:
-        """Check for non-stub concepts/relationships missing definitions.
+            if concept.is_ghost:
+                continue  # Ghosts are already errors
 
-        W104: Configurable severity.
-        """
-        severity = _rule_to_severity(
-            self.config.validation.get_severity("missing_definitions", "gold")
-        )
-        if severity is None:
-            return
+            status = statuses[concept_id]
+            definition = concept.definition
 
-        # Check concepts
-        for concept_id, concept in self.state.concepts.items():
-            if concept.status == "stub" or concept.is_ghost:
-                continue
-            if not concept.definition:
-                self.issues.append(
+            if unimplemented_severity is not None and not concept.models:
+                unimplemented.append(
                     ValidationIssue(
-                        severity=severity,
-                        code="W104",
-                        message=f"Concept '{concept_id}' is missing a definition",
-                        context={"concept": concept_id, "status": concept.status},
+                        severity=unimplemented_severity,
+                        code=CODE_W102,
+                        message=_MSG_W102.format(concept_id),
+                        context={"concept": concept_id, "status": status},
                     )
                 )
 
-        # Check relationships
-        for rel_id, rel in self.state.relationships.items():
-            if not rel.definition:
-                self.issues.append(
+            if (
+                missing_definition_severity is not None
+                and status != "stub"
+                and not definition
+            ):
+                missing_definitions.append(
                     ValidationIssue(
-                        severity=severity,
-                        code="W104",
-                        message=f"Relationship '{rel_id}' is missing a definition",
-                        context={"relationship": rel_id},
+                        severity=missing_definition_severity,
+                        code=CODE_W104,
+                        message=_MSG_W104_CONCEPT.format(concept_id),
+                        context={"concept": concept_id, "status": status},
                     )
                 )
 
-    def _validate_domain_references(self) -> None:
-        """Validate that concept domain references exist.
-
-        W001: Warning when domain not found.
-        """
-        for concept_id, concept in self.state.concepts.items():
-            if concept.domain and concept.domain not in self.state.domains:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=Severity.WARNING,
-                        code="W001",
-                        message=f"Concept '{concept_id}' references unknown domain '{concept.domain}'",
-                        context={"concept": concept_id, "domain": concept.domain},
+            if status in _STUB_OR_DRAFT:
+                mask = (not domain) | (not concept.owner) << 1 | (not definition) << 2
+                if mask:
+                    names, label = _MISSING_TABLE[mask]
+                    stubs.append(
+                        ValidationIssue(
+                            severity=stub_severity,
+                            code=stub_code,
+                            message=_MSG_STUB_CONCEPT.format(
+                                status.capitalize(), concept_id, label
+                            ),
+                            context={
+                                "concept": concept_id,
+                                "missing": list(names),
+                                "status": status,
+                            },
+                        )
                     )
-                )
 
-    def _check_stub_concepts(self) -> None:
-        """Info messages for stub concepts/relationships (or errors if --no-drafts).
+        return unimplemented, missing_definitions, unknown_domains, stubs
+
+    def _validate_relationships(
+        self,
+        relationships: dict[str, RelationshipState],
+        resolved: dict[str, tuple[bool, bool, str]],
+    ) -> tuple[list[ValidationIssue], list[ValidationIssue]]:
+        """Run every per-relationship check in a single pass.
+
+        W104: Relationship missing a definition (configurable severity)
+        I002: Stub relationship needs enrichment (E202 with --no-drafts)
 
-        I001: Stub concept needs enrichment
-        I002: Stub relationship needs enrichment
+        Returns:
+            Tuple of (W104, I002/E202) issues, each in relationship order
         """
-        # Check concepts
-        for concept_id, concept in self.state.concepts.items():
-            if concept.is_ghost:
-                continue  # Ghosts have their own errors
+        if not relationships:
+            return [], []
 
-            if concept.status in ("stub", "draft"):
-                missing = []
-                if not concept.domain:
-                    missing.append("domain")
-                if not concept.owner:
-                    missing.append("owner")
-                if not concept.definition:
-                    missing.append("definition")
+        missing_definition_severity = self._missing_definition_severity
+        stub_severity = Severity.ERROR if self.no_drafts else Severity.INFO
+        stub_code = CODE_E202 if self.no_drafts else CODE_I002
 
-                if missing:
-                    severity = Severity.ERROR if self.no_drafts else Severity.INFO
-                    code = "E201" if self.no_drafts else "I001"
-                    status_label = concept.status.capitalize()
+        missing_definitions: list[ValidationIssue] = []
+        stubs: list[ValidationIssue] = []
 
-                    self.issues.append(
-                        ValidationIssue(
-                            severity=severity,
-                            code=code,
-                            message=f"{status_label} concept '{concept_id}' needs enrichment: missing {', '.join(missing)}",
-                            context={
-                                "concept": concept_id,
-                                "missing": missing,
-                                "status": concept.status,
-                            },
-                        )
+        for rel_id, rel in relationships.items():
+            definition = rel.definition
+
+            if missing_definition_severity is not None and not definition:
+                missing_definitions.append(
+                    ValidationIssue(
+                        severity=missing_definition_severity,
+                        code=CODE_W104,
+                        message=_MSG_W104_RELATIONSHIP.format(rel_id),
+                        context={"relationship": rel_id},
                     )
+                )
 
-        # Check relationships
-        for _, rel in self.state.relationships.items():
-            status = rel.get_status(self.state.concepts)
+            status = resolved[rel_id][2]
             if status == "stub":
                 missing = []
-                if not rel.definition:
+                if not definition:
                     missing.append("definition")
 
-                severity = Severity.ERROR if self.no_drafts else Severity.INFO
-                code = "E202" if self.no_drafts else "I002"
-
                 if missing:
-                    msg = f"Stub relationship '{rel.name}' needs enrichment: missing {', '.join(missing)}"
+                    message = _MSG_STUB_RELATIONSHIP.format(
+                        rel.name, ", ".join(missing)
+                    )
                 else:
-                    msg = f"Stub relationship '{rel.name}' has stub/ghost endpoint concepts"
+                    message = _MSG_STUB_RELATIONSHIP_ENDPOINTS.format(rel.name)
 
-                self.issues.append(
+                stubs.append(
                     ValidationIssue(
-                        severity=severity,
-                        code=code,
-                        message=msg,
+                        severity=stub_severity,
+                        code=stub_code,
+                        message=message,
                         context={
                             "relationship": rel.name,
                             "missing": missing,
@@ -283,13 +475,15 @@ class Validator:
                     )
                 )
 
+        return missing_definitions, stubs
+
     def has_errors(self) -> bool:
         """Check if there are any error-level issues.
 
         Returns:
             True if there are errors, False otherwise
         """
-        return any(issue.severity == Severity.ERROR for issue in self.issues)
+        return self._has_error
 
     def get_summary(self) -> dict[str, int]:
         """Get summary counts by severity.
@@ -297,18 +491,7 @@ class Validator:
         Returns:
             Dictionary mapping severity to count
         """
-        summary = {
-            "errors": 0,
-            "warnings": 0,
-            "info": 0,
-        }
-
-        for issue in self.issues:
-            if issue.severity == Severity.ERROR:
-                summary["errors"] += 1
-            elif issue.severity == Severity.WARNING:
-                summary["warnings"] += 1
-            elif issue.severity == Severity.INFO:
-                summary["info"] += 1
-
+        summary = dict.fromkeys(_SUMMARY_KEYS.values(), 0)
+        for issue in self._issues:
+            summary[_SUMMARY_KEYS[issue.severity]] += 1
         return summary
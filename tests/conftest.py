@@ -0,0 +1,75 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tests.helpers import link_tree
+
+DBT_PROJECT_YAML = b"name: test\n"
+
+# conceptual.yml shared by tests that only need a loadable project
+CONCEPTUAL_TEMPLATE_YAML = b"""\
+version: 1
+concepts:
+  customer:
+    name: Customer
+    domain: party
+domains:
+  party:
+    name: Party
+"""
+
+
+@pytest.fixture(scope="session")
+def tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session directory holding read-only files shared between tests."""
+    root = tmp_path_factory.mktemp("shared")
+    (root / "dbt_project.yml").write_bytes(DBT_PROJECT_YAML)
+    return root
+
+
+@pytest.fixture
+def project_dir(tmp_root: Path, tmp_path: Path) -> Path:
+    """Empty dbt project directory with the shared dbt_project.yml.
+
+    The file is hard-linked from the session directory, so tests must not
+    write to it in place.
+    """
+    project = tmp_path / "proj"
+    project.mkdir()
+    try:
+        os.link(tmp_root / "dbt_project.yml", project / "dbt_project.yml")
+    except OSError:
+        shutil.copyfile(tmp_root / "dbt_project.yml", project / "dbt_project.yml")
+    return project
+
+
+@pytest.fixture(scope="session")
+def conceptual_project_template(
+    tmp_root: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Read-only project with dbt_project.yml and CONCEPTUAL_TEMPLATE_YAML."""
+    template = tmp_path_factory.mktemp("conceptual_project")
+    shutil.copyfile(tmp_root / "dbt_project.yml", template / "dbt_project.yml")
+    (template / "conceptual.yml").write_bytes(CONCEPTUAL_TEMPLATE_YAML)
+    return template
+
+
+@pytest.fixture
+def conceptual_project(conceptual_project_template: Path, tmp_path: Path) -> Path:
+    """Per-test clone of the conceptual project template.
+
+    Files are hard-linked where possible, so tests must not write to them
+    in place.
+    """
+    return link_tree(conceptual_project_template, tmp_path / "proj")
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """CliRunner shared by all tests; invoke() isolates each run itself."""
+    return CliRunner()
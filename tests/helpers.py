@@ -0,0 +1,100 @@
+"""Helpers shared by the test modules."""
+
+import json
+import os
+import re
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# libyaml bindings when available, as in the package itself
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_json(text: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_bytes(data: Any) -> bytes:
+    """Serialize data as JSON, which parses as the same YAML document."""
+    return json.dumps(data).encode()
+
+
+def build_project(
+    project_dir: Path,
+    conceptual: Optional[bytes] = None,
+    schema: Optional[bytes] = None,
+) -> Path:
+    """Write project files into an existing dbt project directory.
+
+    Args:
+        project_dir: Directory that already holds dbt_project.yml
+        conceptual: Serialized conceptual.yml, if any
+        schema: Serialized models/marts/schema.yml, if any
+
+    Returns:
+        The project directory
+    """
+    if conceptual is not None:
+        (project_dir / "conceptual.yml").write_bytes(conceptual)
+    if schema is not None:
+        gold_dir = project_dir / "models" / "marts"
+        gold_dir.mkdir(parents=True)
+        (gold_dir / "schema.yml").write_bytes(schema)
+    return project_dir
+
+
+@lru_cache(maxsize=32)
+def _needle_pattern(needles: tuple[str, ...]) -> re.Pattern:
+    """Compile a lookahead alternation that reports every needle position."""
+    return re.compile("(?=(" + "|".join(map(re.escape, needles)) + "))")
+
+
+def missing_substrings(text: str, needles: tuple[str, ...]) -> list[str]:
+    """Return the needles that do not occur in text.
+
+    The text is scanned once for all needles. A needle that shares its
+    start with an earlier one is not reported by that scan, so it is
+    checked separately.
+
+    Args:
+        text: Text to search
+        needles: Substrings that should occur
+
+    Returns:
+        Missing needles, in the given order
+    """
+    found = {m.group(1) for m in _needle_pattern(needles).finditer(text)}
+    return [n for n in needles if n not in found and n not in text]
+
+
+def link_tree(src: Path, dst: Path) -> Path:
+    """Copy a directory tree by hard-linking its files.
+
+    Falls back to plain copies where hard links are unsupported. Linked
+    files share their data with src, so they must not be written in place.
+
+    Args:
+        src: Template directory
+        dst: Destination directory (must not exist)
+
+    Returns:
+        The destination directory
+    """
+    try:
+        shutil.copytree(src, dst, copy_function=os.link)
+    except (OSError, shutil.Error):
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst)
+    return dst
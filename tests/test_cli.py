@@ -1,17 +1,287 @@
 """Tests for CLI commands."""
 
+import io
+import shutil
+from contextlib import redirect_stdout
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from typing import Optional
 
+import click
+import pytest
 import yaml
 from click.testing import CliRunner
 
 from dbt_conceptual.cli import init, main, status, sync, validate
-
-
-def test_cli_main() -> None:
+from tests.helpers import Loader, build_project, link_tree
+
+
+def _invoke(command: click.Command, args: list[str]) -> str:
+    """Run a command in-process, assert it succeeds, and return its stdout.
+
+    Lighter than CliRunner for runs that only need the printed output.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        try:
+            command.main(args, standalone_mode=False)
+        except SystemExit as e:
+            assert not e.code, buffer.getvalue()
+    return buffer.getvalue()
+
+
+# Recurring project payloads, written out as YAML literals
+MINIMAL_CONCEPTUAL = b"version: 1\n"
+
+CUSTOMER_CONCEPTUAL = b"""\
+version: 1
+domains:
+  party:
+    name: Party
+concepts:
+  customer:
+    name: Customer
+    domain: party
+    owner: data_team
+    definition: A customer
+"""
+
+# Stub concept (missing domain)
+STUB_CONCEPTUAL = b"""\
+version: 1
+concepts:
+  payment:
+    name: Payment
+"""
+
+CUSTOMER_ORDER_CONCEPTUAL = b"""\
+version: 1
+domains:
+  party:
+    name: Party
+concepts:
+  customer:
+    name: Customer
+    domain: party
+    owner: data_team
+    definition: A customer
+  order:
+    name: Order
+    domain: party
+    owner: data_team
+    definition: An order
+relationships:
+  - verb: places
+    from: customer
+    to: order
+"""
+
+# Draft concept (missing owner)
+DRAFT_CONCEPTUAL = b"""\
+version: 1
+domains:
+  party:
+    name: Party
+concepts:
+  customer:
+    name: Customer
+    domain: party
+    definition: A customer
+"""
+
+TWO_DOMAIN_CONCEPTUAL = b"""\
+version: 1
+domains:
+  party:
+    name: Party
+  transaction:
+    name: Transaction
+concepts:
+  customer:
+    name: Customer
+    domain: party
+    owner: data_team
+    definition: A customer
+  order:
+    name: Order
+    domain: transaction
+    owner: data_team
+    definition: An order
+relationships:
+  - verb: places
+    from: customer
+    to: order
+"""
+
+# Relationship referencing an unknown concept
+UNKNOWN_ENDPOINT_CONCEPTUAL = b"""\
+version: 1
+concepts:
+  customer:
+    name: Customer
+relationships:
+  - verb: places
+    from: customer
+    to: unknown_concept
+"""
+
+DIM_CUSTOMER_SCHEMA = b"""\
+version: 2
+models:
+  - name: dim_customer
+    meta:
+      concept: customer
+"""
+
+CUSTOMER_ORDER_SCHEMA = b"""\
+version: 2
+models:
+  - name: dim_customer
+    meta:
+      concept: customer
+  - name: fact_orders
+    meta:
+      concept: order
+"""
+
+
+ORPHAN_SCHEMA = b"""\
+version: 2
+models:
+  - name: dim_orphan
+"""
+
+PRODUCT_SCHEMA = b"""\
+version: 2
+models:
+  - name: dim_product
+"""
+
+PRODUCT_SALES_SCHEMA = b"""\
+version: 2
+models:
+  - name: dim_product
+  - name: fact_sales
+"""
+
+PRODUCT_CUSTOMER_SCHEMA = b"""\
+version: 2
+models:
+  - name: dim_product
+  - name: dim_customer
+"""
+
+# (command, conceptual.yml, schema.yml, expected output) for successful runs
+CLI_CASES = [
+    pytest.param(
+        status,
+        MINIMAL_CONCEPTUAL,
+        ORPHAN_SCHEMA,
+        ["Orphan Models", "dim_orphan"],
+        id="status_with_orphans",
+    ),
+    pytest.param(
+        status,
+        CUSTOMER_ORDER_CONCEPTUAL,
+        CUSTOMER_ORDER_SCHEMA,
+        ["Relationships", "places"],
+        id="status_with_relationships",
+    ),
+    # Stub concepts show warning icon and missing attributes
+    pytest.param(
+        status,
+        STUB_CONCEPTUAL,
+        None,
+        ["payment", "missing"],
+        id="status_with_stub_concept",
+    ),
+    # Draft concept missing owner
+    pytest.param(
+        status,
+        DRAFT_CONCEPTUAL,
+        None,
+        ["customer", "missing: owner", "Concepts Needing Attention"],
+        id="status_with_draft_concept_missing_attrs",
+    ),
+    pytest.param(
+        validate,
+        TWO_DOMAIN_CONCEPTUAL,
+        CUSTOMER_ORDER_SCHEMA,
+        ["places"],
+        id="validate_with_relationship",
+    ),
+    pytest.param(
+        validate,
+        STUB_CONCEPTUAL,
+        None,
+        ["INFO"],
+        id="validate_with_info_messages",
+    ),
+    pytest.param(
+        sync,
+        MINIMAL_CONCEPTUAL,
+        PRODUCT_SCHEMA,
+        ["Found 1 orphan model", "dim_product", "Use --create-stubs"],
+        id="sync_with_orphans",
+    ),
+]
+
+# (command, expected output) for successful runs on the customer project
+CUSTOMER_CASES = [
+    pytest.param(
+        status,
+        ["Concepts by Domain", "Party", "customer"],
+        id="status_with_project",
+    ),
+    pytest.param(
+        validate,
+        ["PASSED"],
+        id="validate_no_errors",
+    ),
+    # Warnings are not errors
+    pytest.param(
+        validate,
+        ["customer"],
+        id="validate_with_warnings_only",
+    ),
+    pytest.param(
+        sync,
+        ["No orphan models found"],
+        id="sync_no_orphans",
+    ),
+]
+
+# (command, conceptual.yml, expected output) for runs exiting with 1
+CLI_ERROR_CASES = [
+    pytest.param(
+        status,
+        None,
+        ["conceptual.yml not found"],
+        id="status_no_conceptual_file",
+    ),
+    pytest.param(
+        validate,
+        None,
+        ["conceptual.yml not found"],
+        id="validate_without_conceptual_file",
+    ),
+    # Relationship referencing unknown concept fails with E002
+    pytest.param(
+        validate,
+        UNKNOWN_ENDPOINT_CONCEPTUAL,
+        ["FAILED", "E002"],
+        id="validate_with_errors",
+    ),
+    pytest.param(
+        sync,
+        None,
+        ["conceptual.yml not found"],
+        id="sync_without_conceptual_file",
+    ),
+]
+
+
+def test_cli_main(runner: CliRunner) -> None:
     """Test main CLI entry point."""
-    runner = CliRunner()
     result = runner.invoke(main, ["--help"])
     assert result.exit_code == 0
     assert "dbt-conceptual" in result.output
@@ -20,696 +290,143 @@ def test_cli_main() -> None:
     assert "validate" in result.output
 
 
-def test_cli_init() -> None:
+def test_cli_init(runner: CliRunner, project_dir: Path) -> None:
     """Test init command creates files."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
+    result = runner.invoke(init, ["--project-dir", str(project_dir)])
 
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
+    assert result.exit_code == 0
+    assert "Initialization complete" in result.output
 
-        result = runner.invoke(init, ["--project-dir", str(tmppath)])
+    # Check conceptual.yml was created in project root
+    conceptual_file = project_dir / "conceptual.yml"
+    assert conceptual_file.exists()
 
-        assert result.exit_code == 0
-        assert "Initialization complete" in result.output
 
-        # Check conceptual.yml was created in project root
-        conceptual_file = tmppath / "conceptual.yml"
-        assert conceptual_file.exists()
+def test_cli_init_already_exists(runner: CliRunner, project_dir: Path) -> None:
+    """Test init command when files already exist."""
+    # Run init twice
+    runner.invoke(init, ["--project-dir", str(project_dir)])
+    result = runner.invoke(init, ["--project-dir", str(project_dir)])
 
+    assert result.exit_code == 0
+    assert "already exists" in result.output
 
-def test_cli_init_already_exists() -> None:
-    """Test init command when files already exist."""
-    runner = CliRunner()
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Run init twice
-        runner.invoke(init, ["--project-dir", str(tmppath)])
-        result = runner.invoke(init, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "already exists" in result.output
-
-
-def test_cli_status_no_conceptual_file() -> None:
-    """Test status command without conceptual.yml."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        result = runner.invoke(status, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 1
-        assert "conceptual.yml not found" in result.output
-
-
-def test_cli_status_with_project() -> None:
-    """Test status command with a valid project."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml in project root
-        conceptual_data = {
-            "version": 1,
-            "domains": {"party": {"name": "Party"}},
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "A customer",
-                }
-            },
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        # Create a gold model
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_customer", "meta": {"concept": "customer"}}
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(status, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "Concepts by Domain" in result.output
-        assert "Party" in result.output
-        assert "customer" in result.output
-
-
-def test_cli_validate_no_errors() -> None:
-    """Test validate command with no errors."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml in project root
-        conceptual_data = {
-            "version": 1,
-            "domains": {"party": {"name": "Party"}},
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "A customer",
-                }
-            },
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        # Create models
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_customer", "meta": {"concept": "customer"}}
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(validate, ["--project-dir", str(tmppath)])
-
-        # Should pass
-        assert "PASSED" in result.output
-
-
-def test_cli_validate_with_errors() -> None:
-    """Test validate command with validation errors."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with relationship referencing unknown concept
-        conceptual_data = {
-            "version": 1,
-            "concepts": {
-                "customer": {"name": "Customer"},
-            },
-            "relationships": [
-                {"verb": "places", "from": "customer", "to": "unknown_concept"}
-            ],
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        result = runner.invoke(validate, ["--project-dir", str(tmppath)])
-
-        # Should fail with E002 (unknown reference)
-        assert result.exit_code == 1
-        assert "FAILED" in result.output
-        assert "E002" in result.output
-
-
-def test_cli_status_with_orphans() -> None:
-    """Test status command displays orphan models."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create minimal conceptual.yml in project root
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump({"version": 1}, f)
-
-        # Create orphan model
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump({"version": 2, "models": [{"name": "dim_orphan"}]}, f)
-
-        result = runner.invoke(status, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "Orphan Models" in result.output
-        assert "dim_orphan" in result.output
-
-
-def test_cli_status_with_relationships() -> None:
-    """Test status command displays relationships."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with relationships
-        conceptual_data = {
-            "version": 1,
-            "domains": {"party": {"name": "Party"}},
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "A customer",
-                },
-                "order": {
-                    "name": "Order",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "An order",
-                },
-            },
-            "relationships": [{"verb": "places", "from": "customer", "to": "order"}],
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        # Create models for both concepts
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_customer", "meta": {"concept": "customer"}},
-                        {"name": "fact_orders", "meta": {"concept": "order"}},
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(status, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "Relationships" in result.output
-        assert "places" in result.output
-
-
-def test_cli_status_with_stub_concept() -> None:
-    """Test status command shows stub concepts with missing fields."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with stub (missing domain)
-        conceptual_data = {
-            "version": 1,
-            "concepts": {"payment": {"name": "Payment"}},
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        result = runner.invoke(status, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "payment" in result.output
-        # Stub concepts show warning icon and missing attributes
-        assert "missing" in result.output
-
-
-def test_cli_validate_with_warnings_only() -> None:
-    """Test validate command with warnings but no errors."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with a concept that has domain/owner/definition
-        conceptual_data = {
-            "version": 1,
-            "domains": {"party": {"name": "Party"}},
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "A customer",
-                }
-            },
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        # Create gold model
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_customer", "meta": {"concept": "customer"}}
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(validate, ["--project-dir", str(tmppath)])
-
-        # Should pass (warnings are not errors)
-        assert "customer" in result.output
-
-
-def test_cli_init_without_dbt_project() -> None:
+def test_cli_init_without_dbt_project(runner: CliRunner, tmp_path: Path) -> None:
     """Test init command fails without dbt_project.yml."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        result = runner.invoke(init, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 1
-        assert "dbt_project.yml not found" in result.output
+    result = runner.invoke(init, ["--project-dir", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "dbt_project.yml not found" in result.output
+
+
+@pytest.mark.parametrize(("command", "conceptual", "schema", "expected"), CLI_CASES)
+def test_cli_command_output(
+    project_dir: Path,
+    command: click.Command,
+    conceptual: bytes,
+    schema: Optional[bytes],
+    expected: list[str],
+) -> None:
+    """Test a command's output for a given project."""
+    build_project(project_dir, conceptual, schema)
 
+    output = _invoke(command, ["--project-dir", str(project_dir)])
 
-def test_cli_validate_without_conceptual_file() -> None:
-    """Test validate command fails without conceptual.yml."""
-    runner = CliRunner()
+    for text in expected:
+        assert text in output
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
 
-        # Create dbt_project.yml only
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
+@pytest.fixture(scope="session")
+def customer_template(tmp_root: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only project with the customer concept and dim_customer model."""
+    template = tmp_path_factory.mktemp("customer_project")
+    shutil.copyfile(tmp_root / "dbt_project.yml", template / "dbt_project.yml")
+    return build_project(template, CUSTOMER_CONCEPTUAL, DIM_CUSTOMER_SCHEMA)
 
-        result = runner.invoke(validate, ["--project-dir", str(tmppath)])
 
-        assert result.exit_code == 1
-        assert "conceptual.yml not found" in result.output
+@pytest.fixture
+def customer_project(customer_template: Path, tmp_path: Path) -> Path:
+    """Per-test clone of the customer template, hard-linked where possible."""
+    return link_tree(customer_template, tmp_path / "proj")
 
 
-def test_cli_validate_with_relationship() -> None:
-    """Test validate shows relationships."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with relationship
-        conceptual_data = {
-            "version": 1,
-            "domains": {
-                "party": {"name": "Party"},
-                "transaction": {"name": "Transaction"},
-            },
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "A customer",
-                },
-                "order": {
-                    "name": "Order",
-                    "domain": "transaction",
-                    "owner": "data_team",
-                    "definition": "An order",
-                },
-            },
-            "relationships": [{"verb": "places", "from": "customer", "to": "order"}],
-        }
+@pytest.mark.parametrize(("command", "expected"), CUSTOMER_CASES)
+def test_cli_customer_project_output(
+    customer_project: Path, command: click.Command, expected: list[str]
+) -> None:
+    """Test a read-only command's output for the customer project."""
+    output = _invoke(command, ["--project-dir", str(customer_project)])
 
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        # Create models for both concepts
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_customer", "meta": {"concept": "customer"}},
-                        {"name": "fact_orders", "meta": {"concept": "order"}},
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(validate, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "places" in result.output
-
-
-def test_cli_validate_with_info_messages() -> None:
-    """Test validate command displays info messages."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with stub concept (missing domain generates stub)
-        conceptual_data = {
-            "version": 1,
-            "concepts": {"payment": {"name": "Payment"}},
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        result = runner.invoke(validate, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "INFO" in result.output
-
-
-def test_cli_status_with_draft_concept_missing_attrs() -> None:
-    """Test status shows missing attributes for draft concepts."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with draft concept missing owner
-        conceptual_data = {
-            "version": 1,
-            "domains": {"party": {"name": "Party"}},
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "definition": "A customer",
-                    # owner is missing
-                }
-            },
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        result = runner.invoke(status, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "customer" in result.output
-        assert "missing: owner" in result.output
-        assert "Concepts Needing Attention" in result.output
-
-
-def test_cli_sync_no_orphans() -> None:
-    """Test sync command with no orphan models."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create conceptual.yml with concept
-        conceptual_data = {
-            "version": 1,
-            "domains": {"party": {"name": "Party"}},
-            "concepts": {
-                "customer": {
-                    "name": "Customer",
-                    "domain": "party",
-                    "owner": "data_team",
-                    "definition": "A customer",
-                }
-            },
-        }
+    for text in expected:
+        assert text in output
 
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
 
-        # Create gold model with concept tag
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
+@pytest.mark.parametrize(("command", "conceptual", "expected"), CLI_ERROR_CASES)
+def test_cli_command_failure(
+    runner: CliRunner,
+    project_dir: Path,
+    command: click.Command,
+    conceptual: Optional[bytes],
+    expected: list[str],
+) -> None:
+    """Test a command exits with 1 and reports why."""
+    build_project(project_dir, conceptual)
 
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_customer", "meta": {"concept": "customer"}}
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(sync, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "No orphan models found" in result.output
+    result = runner.invoke(command, ["--project-dir", str(project_dir)])
 
+    assert result.exit_code == 1
+    for text in expected:
+        assert text in result.output
 
-def test_cli_sync_with_orphans() -> None:
-    """Test sync command displays orphan models."""
-    runner = CliRunner()
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create minimal conceptual.yml
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump({"version": 1}, f)
-
-        # Create orphan model
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump({"version": 2, "models": [{"name": "dim_product"}]}, f)
-
-        result = runner.invoke(sync, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 0
-        assert "Found 1 orphan model" in result.output
-        assert "dim_product" in result.output
-        assert "Use --create-stubs" in result.output
-
-
-def test_cli_sync_create_stubs() -> None:
+def test_cli_sync_create_stubs(runner: CliRunner, project_dir: Path) -> None:
     """Test sync command creates stub concepts."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create minimal conceptual.yml
-        conceptual_file = tmppath / "conceptual.yml"
-        with open(conceptual_file, "w") as f:
-            yaml.dump({"version": 1}, f)
-
-        # Create orphan models
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [{"name": "dim_product"}, {"name": "fact_sales"}],
-                },
-                f,
-            )
-
-        result = runner.invoke(sync, ["--project-dir", str(tmppath), "--create-stubs"])
-
-        assert result.exit_code == 0
-        assert "Created 2 stub concept" in result.output
-        assert "product" in result.output
-        assert "sales" in result.output
-
-        # Verify stubs were created in file
-        with open(conceptual_file) as f:
-            data = yaml.safe_load(f)
-            assert "product" in data["concepts"]
-            assert "sales" in data["concepts"]
-
-
-def test_cli_sync_specific_model() -> None:
+    # Minimal conceptual.yml plus orphan models
+    conceptual_file = project_dir / "conceptual.yml"
+    build_project(
+        project_dir,
+        MINIMAL_CONCEPTUAL,
+        PRODUCT_SALES_SCHEMA,
+    )
+
+    result = runner.invoke(sync, ["--project-dir", str(project_dir), "--create-stubs"])
+
+    assert result.exit_code == 0
+    assert "Created 2 stub concept" in result.output
+    assert "product" in result.output
+    assert "sales" in result.output
+
+    # Verify stubs were created in file
+    data = yaml.load(conceptual_file.read_bytes(), Loader=Loader)
+    assert set(data["concepts"]) == {"product", "sales"}
+
+
+def test_cli_sync_specific_model(runner: CliRunner, project_dir: Path) -> None:
     """Test sync command with --model flag."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        # Create minimal conceptual.yml
-        conceptual_file = tmppath / "conceptual.yml"
-        with open(conceptual_file, "w") as f:
-            yaml.dump({"version": 1}, f)
-
-        # Create multiple orphan models
-        gold_dir = tmppath / "models" / "marts"
-        gold_dir.mkdir(parents=True)
-        with open(gold_dir / "schema.yml", "w") as f:
-            yaml.dump(
-                {
-                    "version": 2,
-                    "models": [
-                        {"name": "dim_product"},
-                        {"name": "dim_customer"},
-                    ],
-                },
-                f,
-            )
-
-        result = runner.invoke(
-            sync,
-            [
-                "--project-dir",
-                str(tmppath),
-                "--create-stubs",
-                "--model",
-                "dim_product",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "Created 1 stub concept" in result.output
-        assert "product" in result.output
-
-        # Verify only one stub was created
-        with open(conceptual_file) as f:
-            data = yaml.safe_load(f)
-            assert "product" in data["concepts"]
-            assert "customer" not in data["concepts"]
-
-
-def test_cli_sync_without_conceptual_file() -> None:
-    """Test sync command fails without conceptual.yml."""
-    runner = CliRunner()
-
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create dbt_project.yml only
-        with open(tmppath / "dbt_project.yml", "w") as f:
-            yaml.dump({"name": "test"}, f)
-
-        result = runner.invoke(sync, ["--project-dir", str(tmppath)])
-
-        assert result.exit_code == 1
-        assert "conceptual.yml not found" in result.output
+    # Minimal conceptual.yml plus multiple orphan models
+    conceptual_file = project_dir / "conceptual.yml"
+    build_project(
+        project_dir,
+        MINIMAL_CONCEPTUAL,
+        PRODUCT_CUSTOMER_SCHEMA,
+    )
+
+    result = runner.invoke(
+        sync,
+        [
+            "--project-dir",
+            str(project_dir),
+            "--create-stubs",
+            "--model",
+            "dim_product",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Created 1 stub concept" in result.output
+    assert "product" in result.output
+
+    # Verify only one stub was created
+    data = yaml.load(conceptual_file.read_bytes(), Loader=Loader)
+    assert set(data["concepts"]) == {"product"}
@@ -3,11 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import click
 import pytest
-import yaml
 
 from dbt_conceptual.cli_utils import (
     ConceptualFileNotFound,
@@ -15,75 +13,57 @@ from dbt_conceptual.cli_utils import (
     project_options,
     require_conceptual_yml,
 )
+from dbt_conceptual.config import Config
+from dbt_conceptual.parser import StateBuilder
 
 
 class TestLoadProjectState:
     """Tests for load_project_state function."""
 
-    def test_load_basic_state(self) -> None:
+    def test_load_basic_state(self, tmp_path: Path) -> None:
         """Test loading a basic project state."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            # Create conceptual.yml in project root
-            conceptual_data = {
-                "version": 1,
-                "concepts": {
-                    "customer": {"name": "Customer", "domain": "party"},
-                },
-                "domains": {
-                    "party": {"name": "Party"},
-                },
-            }
-
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump(conceptual_data, f)
-
-            state, config = load_project_state(project_dir=tmppath)
-
-            assert "customer" in state.concepts
-            assert state.concepts["customer"].name == "Customer"
-            assert config.project_dir == tmppath
-
-    def test_raises_when_conceptual_file_missing(self) -> None:
+        conceptual_data = {
+            "version": 1,
+            "concepts": {
+                "customer": {"name": "Customer", "domain": "party"},
+            },
+            "domains": {
+                "party": {"name": "Party"},
+            },
+        }
+
+        config = Config.from_mapping(conceptual_data, project_dir=tmp_path)
+        state = StateBuilder(config).build_from_mapping(conceptual_data)
+
+        assert "customer" in state.concepts
+        assert state.concepts["customer"].name == "Customer"
+        assert config.project_dir == tmp_path
+
+    def test_load_from_conceptual_file(self, conceptual_project: Path) -> None:
+        """Test loading state from conceptual.yml on disk."""
+        state, config = load_project_state(project_dir=conceptual_project)
+
+        assert "customer" in state.concepts
+        assert config.project_dir == conceptual_project
+
+    def test_raises_when_conceptual_file_missing(self, project_dir: Path) -> None:
         """Test that ConceptualFileNotFound is raised when file is missing."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        with pytest.raises(ConceptualFileNotFound) as exc_info:
+            load_project_state(project_dir=project_dir)
 
-            # Create only dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
+        assert "conceptual.yml not found" in str(exc_info.value)
+        assert exc_info.value.path.name == "conceptual.yml"
 
-            with pytest.raises(ConceptualFileNotFound) as exc_info:
-                load_project_state(project_dir=tmppath)
-
-            assert "conceptual.yml not found" in str(exc_info.value)
-            assert exc_info.value.path.name == "conceptual.yml"
-
-    def test_with_custom_gold_paths(self) -> None:
+    def test_with_custom_gold_paths(self, tmp_path: Path) -> None:
         """Test loading with custom gold paths."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            # Create conceptual.yml in project root
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump({"version": 1, "concepts": {}}, f)
-
-            state, config = load_project_state(
-                project_dir=tmppath,
-                gold_paths=["models/custom_gold"],
-            )
+        config = Config.from_mapping(
+            {"version": 1, "concepts": {}},
+            project_dir=tmp_path,
+            gold_paths=["models/custom_gold"],
+        )
 
-            # Verify config has custom paths
-            assert "models/custom_gold" in config.gold_paths
+        # Verify config has custom paths
+        assert "models/custom_gold" in config.gold_paths
 
 
 class TestProjectOptions:
@@ -125,7 +105,7 @@ class TestProjectOptions:
 class TestRequireConceptualYml:
     """Tests for require_conceptual_yml decorator."""
 
-    def test_injects_state_and_config(self) -> None:
+    def test_injects_state_and_config(self, conceptual_project: Path) -> None:
         """Test that decorator injects state and config."""
         captured_state = None
         captured_config = None
@@ -141,23 +121,12 @@ class TestRequireConceptualYml:
             captured_state = state
             captured_config = config
 
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        test_func(project_dir=conceptual_project, gold_paths=())
 
-            # Create dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
+        assert captured_state is not None
+        assert captured_config is not None
 
-            # Create conceptual.yml in project root
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump({"version": 1, "concepts": {}}, f)
-
-            test_func(project_dir=tmppath, gold_paths=())
-
-            assert captured_state is not None
-            assert captured_config is not None
-
-    def test_raises_abort_when_file_missing(self) -> None:
+    def test_raises_abort_when_file_missing(self, project_dir: Path) -> None:
         """Test that decorator raises click.Abort when file is missing."""
 
         @require_conceptual_yml
@@ -167,15 +136,8 @@ class TestRequireConceptualYml:
         ) -> None:
             pass
 
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create only dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            with pytest.raises(click.Abort):
-                test_func(project_dir=tmppath, gold_paths=())
+        with pytest.raises(click.Abort):
+            test_func(project_dir=project_dir, gold_paths=())
 
 
 class TestConceptualFileNotFound:
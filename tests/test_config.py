@@ -1,82 +1,77 @@
 """Tests for configuration loading from conceptual.yml."""
 
+import os
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
-import yaml
-
-from dbt_conceptual.config import Config, RuleSeverity, ValidationConfig
+from dbt_conceptual.config import (
+    Config,
+    RuleSeverity,
+    ValidationConfig,
+    _read_conceptual_cached,
+    load_conceptual_data,
+)
+
+# conceptual.yml with a custom config section
+CUSTOM_CONFIG_YAML = b"""\
+config:
+  scan:
+    gold:
+    - models/marts/**/*.yml
+    - models/semantic/**/*.yml
+  validation:
+    defaults:
+      orphan_models: error
+      unimplemented_concepts: ignore
+domains:
+  sales:
+    display_name: Sales
+concepts: {}
+relationships: []
+"""
 
 
 def test_config_defaults() -> None:
     """Test that config loads with defaults."""
-    with TemporaryDirectory() as tmpdir:
-        config = Config.load(project_dir=Path(tmpdir))
+    config = Config.from_mapping(None, project_dir=Path("/tmp"))
 
-        assert config.project_dir == Path(tmpdir)
-        assert config.gold_paths == ["models/marts/**/*.yml"]
-        # Check default validation config
-        assert config.validation.orphan_models == RuleSeverity.WARN
-        assert config.validation.unimplemented_concepts == RuleSeverity.WARN
-        assert config.validation.missing_definitions == RuleSeverity.IGNORE
+    assert config.project_dir == Path("/tmp")
+    assert config.gold_paths == ["models/marts/**/*.yml"]
+    # Check default validation config
+    assert config.validation.orphan_models == RuleSeverity.WARN
+    assert config.validation.unimplemented_concepts == RuleSeverity.WARN
+    assert config.validation.missing_definitions == RuleSeverity.IGNORE
 
 
-def test_config_from_conceptual_yml() -> None:
+def test_config_from_conceptual_yml(tmp_path: Path) -> None:
     """Test that config loads from conceptual.yml."""
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create conceptual.yml with custom config
-        conceptual_data = {
-            "config": {
-                "scan": {"gold": ["models/marts/**/*.yml", "models/semantic/**/*.yml"]},
-                "validation": {
-                    "defaults": {
-                        "orphan_models": "error",
-                        "unimplemented_concepts": "ignore",
-                    }
-                },
-            },
-            "domains": {"sales": {"display_name": "Sales"}},
-            "concepts": {},
-            "relationships": [],
-        }
+    (tmp_path / "conceptual.yml").write_bytes(CUSTOM_CONFIG_YAML)
 
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
+    config = Config.load(project_dir=tmp_path)
 
-        config = Config.load(project_dir=tmppath)
-
-        assert config.gold_paths == [
-            "models/marts/**/*.yml",
-            "models/semantic/**/*.yml",
-        ]
-        assert config.validation.orphan_models == RuleSeverity.ERROR
-        assert config.validation.unimplemented_concepts == RuleSeverity.IGNORE
+    assert config.gold_paths == [
+        "models/marts/**/*.yml",
+        "models/semantic/**/*.yml",
+    ]
+    assert config.validation.orphan_models == RuleSeverity.ERROR
+    assert config.validation.unimplemented_concepts == RuleSeverity.IGNORE
 
 
 def test_config_cli_overrides() -> None:
     """Test that CLI arguments override conceptual.yml."""
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create conceptual.yml
-        conceptual_data = {
-            "config": {
-                "scan": {"gold": ["models/marts/**/*.yml"]},
-            },
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        # CLI overrides
-        config = Config.load(
-            project_dir=tmppath,
-            gold_paths=["models/gold/**/*.yml"],
-        )
+    conceptual_data = {
+        "config": {
+            "scan": {"gold": ["models/marts/**/*.yml"]},
+        },
+    }
+
+    # CLI overrides
+    config = Config.from_mapping(
+        conceptual_data,
+        project_dir=Path("/tmp"),
+        gold_paths=["models/gold/**/*.yml"],
+    )
 
-        assert config.gold_paths == ["models/gold/**/*.yml"]
+    assert config.gold_paths == ["models/gold/**/*.yml"]
 
 
 def test_get_layer() -> None:
@@ -90,42 +85,40 @@ def test_get_layer() -> None:
     assert config.get_layer("models/gold/fact_orders.yml") == "gold"
     assert config.get_layer("models/staging/stg_orders.yml") is None
 
+    # Patterns are recompiled when gold_paths is replaced
+    config.gold_paths = ["models/staging"]
+    assert config.get_layer("models/staging/stg_orders.yml") == "gold"
+    assert config.get_layer("models/marts/schema.yml") is None
+
 
 def test_validation_config_from_conceptual_yml() -> None:
     """Test that validation config loads from conceptual.yml."""
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create conceptual.yml with validation config
-        conceptual_data = {
-            "config": {
-                "validation": {
-                    "defaults": {
-                        "orphan_models": "error",
-                        "unimplemented_concepts": "ignore",
-                        "missing_definitions": "warn",
-                    },
-                    "gold": {
-                        "orphan_models": "error",
-                        "missing_definitions": "error",
-                    },
-                }
-            },
-        }
-
-        with open(tmppath / "conceptual.yml", "w") as f:
-            yaml.dump(conceptual_data, f)
-
-        config = Config.load(project_dir=tmppath)
-
-        # Check defaults
-        assert config.validation.orphan_models == RuleSeverity.ERROR
-        assert config.validation.unimplemented_concepts == RuleSeverity.IGNORE
-        assert config.validation.missing_definitions == RuleSeverity.WARN
-
-        # Check layer overrides
-        assert config.validation.gold.orphan_models == RuleSeverity.ERROR
-        assert config.validation.gold.missing_definitions == RuleSeverity.ERROR
+    conceptual_data = {
+        "config": {
+            "validation": {
+                "defaults": {
+                    "orphan_models": "error",
+                    "unimplemented_concepts": "ignore",
+                    "missing_definitions": "warn",
+                },
+                "gold": {
+                    "orphan_models": "error",
+                    "missing_definitions": "error",
+                },
+            }
+        },
+    }
+
+    config = Config.from_mapping(conceptual_data, project_dir=Path("/tmp"))
+
+    # Check defaults
+    assert config.validation.orphan_models == RuleSeverity.ERROR
+    assert config.validation.unimplemented_concepts == RuleSeverity.IGNORE
+    assert config.validation.missing_definitions == RuleSeverity.WARN
+
+    # Check layer overrides
+    assert config.validation.gold.orphan_models == RuleSeverity.ERROR
+    assert config.validation.gold.missing_definitions == RuleSeverity.ERROR
 
 
 def test_validation_config_get_severity() -> None:
@@ -160,3 +153,50 @@ def test_validation_config_defaults() -> None:
     assert config.orphan_models == RuleSeverity.WARN
     assert config.unimplemented_concepts == RuleSeverity.WARN
     assert config.missing_definitions == RuleSeverity.IGNORE
+
+
+def test_load_conceptual_data_cached_until_file_changes(tmp_path: Path) -> None:
+    """Test conceptual.yml is parsed once and re-read after it changes."""
+    conceptual_file = tmp_path / "conceptual.yml"
+    assert load_conceptual_data(conceptual_file) is None
+
+    conceptual_file.write_text("version: 1\n")
+    # Backdate the file so it is past the racy window and gets cached
+    os.utime(conceptual_file, ns=(0, 10**9))
+    misses = _read_conceptual_cached.cache_info().misses
+    first = load_conceptual_data(conceptual_file)
+    assert first == {"version": 1}
+    assert load_conceptual_data(conceptual_file) == first
+    assert _read_conceptual_cached.cache_info().misses == misses + 1
+
+    conceptual_file.write_text("version: 1\nconcepts: {}\n")
+    os.utime(conceptual_file, ns=(0, 2 * 10**9))
+    assert load_conceptual_data(conceptual_file) == {"version": 1, "concepts": {}}
+
+
+def test_load_conceptual_data_returns_independent_copies(tmp_path: Path) -> None:
+    """Test mutating loaded data does not leak into later loads."""
+    conceptual_file = tmp_path / "conceptual.yml"
+    conceptual_file.write_text("version: 1\nconcepts:\n  customer: {}\n")
+    os.utime(conceptual_file, ns=(0, 10**9))
+
+    first = load_conceptual_data(conceptual_file)
+    first["concepts"]["order"] = {}
+
+    assert load_conceptual_data(conceptual_file) == {
+        "version": 1,
+        "concepts": {"customer": {}},
+    }
+
+
+def test_load_conceptual_data_rereads_recent_same_size_edit(tmp_path: Path) -> None:
+    """Test a same-size rewrite with an unchanged mtime is not served stale."""
+    conceptual_file = tmp_path / "conceptual.yml"
+    conceptual_file.write_text("status: draft\n")
+    mtime_ns = conceptual_file.stat().st_mtime_ns
+    assert load_conceptual_data(conceptual_file) == {"status": "draft"}
+
+    # Same size, same inode and, as on a coarse mtime clock, the same mtime
+    conceptual_file.write_text("status: stub!\n")
+    os.utime(conceptual_file, ns=(mtime_ns, mtime_ns))
+    assert load_conceptual_data(conceptual_file) == {"status": "stub!"}
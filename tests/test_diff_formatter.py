@@ -5,6 +5,9 @@ v1.0: Simplified model - uses flat models[] instead of silver_models/gold_models
 
 import json
 
+import pytest
+
+from dbt_conceptual import serialization
 from dbt_conceptual.diff_formatter import (
     format_github,
     format_human,
@@ -12,6 +15,7 @@ from dbt_conceptual.diff_formatter import (
     format_markdown,
 )
 from dbt_conceptual.differ import (
+    ChangeType,
     ConceptChange,
     ConceptualDiff,
     DomainChange,
@@ -410,6 +414,41 @@ class TestFormatJson:
         assert len(data["concept_changes"]) == 1
         assert len(data["relationship_changes"]) == 1
 
+    def test_stdlib_fallback_matches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the stdlib JSON fallback renders the same text as orjson."""
+        pytest.importorskip("orjson")
+        concept = ConceptState(name="Kunde", domain="party", definition="Å café")
+        diff = ConceptualDiff(
+            concept_changes=[
+                ConceptChange(key="customer", change_type="added", new_value=concept)
+            ]
+        )
+        result = format_json(diff)
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert format_json(diff) == result
+        # Escaped ASCII, so print() works whatever the stdout encoding
+        assert result.isascii()
+        assert json.loads(result)["concept_changes"][0]["new_value"]["definition"] == (
+            "Å café"
+        )
+
+    def test_non_string_keys(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test YAML mappings with integer keys serialize as string keys."""
+        # The parser copies YAML values as-is, so mappings can carry int keys
+        concept = ConceptState(name="Customer", definition={1: "one"})
+        diff = ConceptualDiff(
+            concept_changes=[
+                ConceptChange(key="customer", change_type="added", new_value=concept)
+            ]
+        )
+        result = format_json(diff)
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert format_json(diff) == result
+        new_value = json.loads(result)["concept_changes"][0]["new_value"]
+        assert new_value["definition"] == {"1": "one"}
+
 
 class TestFormatMarkdown:
     """Tests for format_markdown function."""
@@ -515,3 +554,37 @@ class TestFormatMarkdown:
         assert "### Relationships" in result
         assert "`customer:places:order`" in result
         assert "cardinality: 1:N" in result
+
+
+class TestChangeType:
+    """Tests for change construction from plain values."""
+
+    def test_string_change_type_is_normalized(self) -> None:
+        """Test plain strings become ChangeType members."""
+        change = DomainChange(key="party", change_type="modified")
+        assert change.change_type is ChangeType.MODIFIED
+        assert change.change_type == "modified"
+
+    def test_modified_fields_dict_is_normalized(self) -> None:
+        """Test {field: (old, new)} dicts become (field, old, new) triples."""
+        change = ConceptChange(
+            key="customer",
+            change_type="modified",
+            modified_fields={"owner": ("team-a", "team-b")},
+        )
+        assert change.modified_fields == (("owner", "team-a", "team-b"),)
+
+    def test_counts_by_section(self) -> None:
+        """Test ConceptualDiff.counts tallies change types per section."""
+        diff = ConceptualDiff(
+            concept_changes=[
+                ConceptChange(key="customer", change_type="added"),
+                ConceptChange(key="order", change_type="added"),
+            ],
+            domain_changes=[DomainChange(key="party", change_type="removed")],
+        )
+        assert diff.counts["concept"] == {"added": 2}
+        assert diff.counts["domain"] == {"removed": 1}
+        assert not diff.counts["relationship"]
+        # Counted once at construction, not rebuilt per access
+        assert diff.counts is diff.counts
@@ -1,11 +1,14 @@
 """Tests for exporter/formats.py module."""
 
-import json
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 
+import pytest
+
+from dbt_conceptual import serialization
 from dbt_conceptual.config import Config
 from dbt_conceptual.exporter.formats import (
+    _build_coverage_dict,
     export_bus_matrix_json,
     export_bus_matrix_markdown,
     export_coverage_json,
@@ -25,10 +28,12 @@ from dbt_conceptual.state import (
     RelationshipState,
 )
 from dbt_conceptual.validator import Severity, ValidationIssue, Validator
+from tests.helpers import load_json, missing_substrings
 
 
-def _create_test_state() -> ProjectState:
-    """Create a test ProjectState with sample data for v1.0."""
+@pytest.fixture(scope="module")
+def sample_state() -> ProjectState:
+    """Sample ProjectState for v1.0, shared read-only by the module's tests."""
     return ProjectState(
         domains={
             "party": DomainState(
@@ -74,16 +79,18 @@ def _create_test_state() -> ProjectState:
     )
 
 
+@pytest.fixture
+def validator(sample_state: ProjectState) -> Validator:
+    """Validator over the sample state; tests assign its issues."""
+    return Validator(Config(project_dir=Path("/tmp")), sample_state)
+
+
 class TestCoverageExporters:
     """Tests for coverage export functions."""
 
-    def test_export_coverage_json_structure(self) -> None:
-        """Test export_coverage_json produces valid JSON structure."""
-        state = _create_test_state()
-        output = StringIO()
-        export_coverage_json(state, output)
-        result = output.getvalue()
-        data = json.loads(result)
+    def test_build_coverage_dict_structure(self, sample_state: ProjectState) -> None:
+        """Test _build_coverage_dict builds the coverage report structure."""
+        data = _build_coverage_dict(sample_state)
 
         # Check summary structure
         assert "summary" in data
@@ -109,20 +116,65 @@ class TestCoverageExporters:
     def test_export_coverage_json_empty_state(self) -> None:
         """Test export_coverage_json with empty state."""
         state = ProjectState()
-        output = StringIO()
+        output = BytesIO()
         export_coverage_json(state, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert data["summary"]["concepts"]["total"] == 0
         assert data["summary"]["concepts"]["completion_percent"] == 0
         assert data["summary"]["coverage"]["models"]["percent"] == 0
 
-    def test_export_coverage_markdown_structure(self) -> None:
+    def test_export_coverage_json_binary_matches_text(
+        self, sample_state: ProjectState
+    ) -> None:
+        """Test JSON written to a binary stream is the UTF-8 of the text output."""
+        text_output = StringIO()
+        export_coverage_json(sample_state, text_output)
+        binary_output = BytesIO()
+        export_coverage_json(sample_state, binary_output)
+
+        assert binary_output.getvalue() == text_output.getvalue().encode()
+
+    def test_export_coverage_json_unbuffered_file(
+        self, sample_state: ProjectState, tmp_path: Path
+    ) -> None:
+        """Test JSON is written as bytes to an unbuffered (FileIO) stream."""
+        text_output = StringIO()
+        export_coverage_json(sample_state, text_output)
+
+        path = tmp_path / "coverage.json"
+        with open(path, "wb", buffering=0) as raw_output:
+            export_coverage_json(sample_state, raw_output)
+
+        assert path.read_bytes() == text_output.getvalue().encode()
+
+    def test_export_coverage_json_integer_domain_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test integer domain ids from YAML export as string keys."""
+        pytest.importorskip("orjson")
+        state = ProjectState(
+            domains={1: DomainState(name="1", display_name="One")},
+            concepts={"customer": ConceptState(name="Customer", domain=1)},
+        )
+        fast_output = BytesIO()
+        export_coverage_json(state, fast_output)
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        stdlib_output = BytesIO()
+        export_coverage_json(state, stdlib_output)
+
+        assert fast_output.getvalue() == stdlib_output.getvalue()
+        data = load_json(fast_output.getvalue())
+        assert data["domains"]["1"]["display_name"] == "One"
+
+    def test_export_coverage_markdown_structure(
+        self, sample_state: ProjectState
+    ) -> None:
         """Test export_coverage_markdown produces valid markdown."""
-        state = _create_test_state()
         output = StringIO()
-        export_coverage_markdown(state, output)
+        export_coverage_markdown(sample_state, output)
         result = output.getvalue()
 
         assert "### Coverage Summary" in result
@@ -152,13 +204,12 @@ class TestCoverageExporters:
 class TestBusMatrixExporters:
     """Tests for bus matrix export functions."""
 
-    def test_export_bus_matrix_json_structure(self) -> None:
+    def test_export_bus_matrix_json_structure(self, sample_state: ProjectState) -> None:
         """Test export_bus_matrix_json produces valid JSON structure."""
-        state = _create_test_state()
-        output = StringIO()
-        export_bus_matrix_json(state, output)
+        output = BytesIO()
+        export_bus_matrix_json(sample_state, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         # v1.0: Bus matrix shows relationships without realization info
         assert "relationships" in data
@@ -172,19 +223,20 @@ class TestBusMatrixExporters:
         state = ProjectState(
             concepts={"customer": ConceptState(name="Customer")},
         )
-        output = StringIO()
+        output = BytesIO()
         export_bus_matrix_json(state, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert data["relationships"] == []
         assert data["summary"]["total_relationships"] == 0
 
-    def test_export_bus_matrix_markdown_structure(self) -> None:
+    def test_export_bus_matrix_markdown_structure(
+        self, sample_state: ProjectState
+    ) -> None:
         """Test export_bus_matrix_markdown produces valid markdown table."""
-        state = _create_test_state()
         output = StringIO()
-        export_bus_matrix_markdown(state, output)
+        export_bus_matrix_markdown(sample_state, output)
         result = output.getvalue()
 
         assert "### Bus Matrix" in result
@@ -206,21 +258,21 @@ class TestBusMatrixExporters:
 class TestStatusExporters:
     """Tests for status export functions."""
 
-    def test_export_status_json_structure(self) -> None:
+    def test_export_status_json_structure(self, sample_state: ProjectState) -> None:
         """Test export_status_json produces valid JSON structure."""
-        state = _create_test_state()
-        output = StringIO()
-        export_status_json(state, output)
+        output = BytesIO()
+        export_status_json(sample_state, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert "summary" in data
         assert "concepts" in data
         assert "relationships" in data
 
         # Check concepts data
-        assert len(data["concepts"]) == 3
-        customer = next(c for c in data["concepts"] if c["id"] == "customer")
+        concepts = {c["id"]: c for c in data["concepts"]}
+        assert len(concepts) == len(data["concepts"]) == 3
+        customer = concepts["customer"]
         assert customer["name"] == "Customer"
         assert customer["domain"] == "party"
         assert customer["model_count"] == 1  # v1.0: flat model count
@@ -228,33 +280,53 @@ class TestStatusExporters:
         # Check relationships data
         assert len(data["relationships"]) == 2
 
-    def test_export_status_markdown_structure(self) -> None:
+    def test_export_status_json_text_stream_is_ascii(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test non-ASCII names are escaped on text streams, with or without orjson."""
+        state = ProjectState(concepts={"cafe": ConceptState(name="Café ☕ 𝄞")})
+        fast_output = StringIO()
+        export_status_json(state, fast_output)
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        stdlib_output = StringIO()
+        export_status_json(state, stdlib_output)
+
+        result = fast_output.getvalue()
+        assert result == stdlib_output.getvalue()
+        assert result.isascii()
+        assert '"Caf\\u00e9 \\u2615 \\ud834\\udd1e"' in result
+
+    def test_export_status_markdown_structure(self, sample_state: ProjectState) -> None:
         """Test export_status_markdown produces valid markdown."""
-        state = _create_test_state()
         output = StringIO()
-        export_status_markdown(state, output)
+        export_status_markdown(sample_state, output)
         result = output.getvalue()
 
-        assert "### Status Summary" in result
-        assert "**Concepts:**" in result
-        assert "**Relationships:**" in result
-        assert "#### Concepts by Domain" in result
-
-        # Check domain groups shown
-        assert "Party Domain" in result
-        assert "| Concept | Status | Models |" in result  # v1.0: flat models column
+        missing = missing_substrings(
+            result,
+            (
+                "### Status Summary",
+                "**Concepts:**",
+                "**Relationships:**",
+                "#### Concepts by Domain",
+                # Domain groups shown
+                "Party Domain",
+                "| Concept | Status | Models |",  # v1.0: flat models column
+            ),
+        )
+        assert not missing
 
 
 class TestOrphansExporters:
     """Tests for orphans export functions."""
 
-    def test_export_orphans_json_structure(self) -> None:
+    def test_export_orphans_json_structure(self, sample_state: ProjectState) -> None:
         """Test export_orphans_json produces valid JSON structure."""
-        state = _create_test_state()
-        output = StringIO()
-        export_orphans_json(state, output)
+        output = BytesIO()
+        export_orphans_json(sample_state, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert "count" in data
         assert "models" in data
@@ -267,26 +339,33 @@ class TestOrphansExporters:
     def test_export_orphans_json_empty(self) -> None:
         """Test export_orphans_json with no orphans."""
         state = ProjectState()
-        output = StringIO()
+        output = BytesIO()
         export_orphans_json(state, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert data["count"] == 0
         assert data["models"] == []
 
-    def test_export_orphans_markdown_with_orphans(self) -> None:
+    def test_export_orphans_markdown_with_orphans(
+        self, sample_state: ProjectState
+    ) -> None:
         """Test export_orphans_markdown lists orphan models."""
-        state = _create_test_state()
         output = StringIO()
-        export_orphans_markdown(state, output)
+        export_orphans_markdown(sample_state, output)
         result = output.getvalue()
 
-        assert "### Orphan Models" in result
-        assert "Found **2 models**" in result
-        assert "| Model | Path |" in result
-        assert "`stg_legacy`" in result
-        assert "`dim_temp`" in result
+        missing = missing_substrings(
+            result,
+            (
+                "### Orphan Models",
+                "Found **2 models**",
+                "| Model | Path |",
+                "`stg_legacy`",
+                "`dim_temp`",
+            ),
+        )
+        assert not missing
 
     def test_export_orphans_markdown_no_orphans(self) -> None:
         """Test export_orphans_markdown with no orphans."""
@@ -303,28 +382,22 @@ class TestOrphansExporters:
 class TestValidationExporters:
     """Tests for validation export functions."""
 
-    def test_export_validation_json_passed(self) -> None:
+    def test_export_validation_json_passed(self, validator: Validator) -> None:
         """Test export_validation_json with passing validation."""
-        state = _create_test_state()
-        config = Config(project_dir=Path("/tmp"))
-        validator = Validator(config, state)
         issues: list[ValidationIssue] = []
 
-        output = StringIO()
+        output = BytesIO()
         export_validation_json(validator, issues, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert data["passed"] is True
         assert "summary" in data
         assert "issues" in data
         assert data["issues"] == []
 
-    def test_export_validation_json_with_issues(self) -> None:
+    def test_export_validation_json_with_issues(self, validator: Validator) -> None:
         """Test export_validation_json with validation issues."""
-        state = _create_test_state()
-        config = Config(project_dir=Path("/tmp"))
-        validator = Validator(config, state)
         issues = [
             ValidationIssue(
                 code="E001",
@@ -342,10 +415,10 @@ class TestValidationExporters:
         # Add issues to validator for summary
         validator.issues = issues
 
-        output = StringIO()
+        output = BytesIO()
         export_validation_json(validator, issues, output)
         result = output.getvalue()
-        data = json.loads(result)
+        data = load_json(result)
 
         assert data["passed"] is False
         assert len(data["issues"]) == 2
@@ -354,11 +427,8 @@ class TestValidationExporters:
         assert data["summary"]["errors"] == 1
         assert data["summary"]["warnings"] == 1
 
-    def test_export_validation_markdown_passed(self) -> None:
+    def test_export_validation_markdown_passed(self, validator: Validator) -> None:
         """Test export_validation_markdown with passing validation."""
-        state = _create_test_state()
-        config = Config(project_dir=Path("/tmp"))
-        validator = Validator(config, state)
         issues: list[ValidationIssue] = []
 
         output = StringIO()
@@ -368,11 +438,8 @@ class TestValidationExporters:
         assert "### " in result  # Has a header
         assert "Validation Passed" in result
 
-    def test_export_validation_markdown_with_errors(self) -> None:
+    def test_export_validation_markdown_with_errors(self, validator: Validator) -> None:
         """Test export_validation_markdown with errors."""
-        state = _create_test_state()
-        config = Config(project_dir=Path("/tmp"))
-        validator = Validator(config, state)
         issues = [
             ValidationIssue(
                 code="E001",
@@ -387,17 +454,22 @@ class TestValidationExporters:
         export_validation_markdown(validator, issues, output)
         result = output.getvalue()
 
-        assert "Validation Failed" in result
-        assert "Errors" in result
-        assert "| Count |" in result
-        assert "**E001**" in result
-        assert "Test error message" in result
+        missing = missing_substrings(
+            result,
+            (
+                "Validation Failed",
+                "Errors",
+                "| Count |",
+                "**E001**",
+                "Test error message",
+            ),
+        )
+        assert not missing
 
-    def test_export_validation_markdown_with_warnings(self) -> None:
+    def test_export_validation_markdown_with_warnings(
+        self, validator: Validator
+    ) -> None:
         """Test export_validation_markdown with warnings only."""
-        state = _create_test_state()
-        config = Config(project_dir=Path("/tmp"))
-        validator = Validator(config, state)
         issues = [
             ValidationIssue(
                 code="W001",
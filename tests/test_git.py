@@ -2,259 +2,186 @@
 
 import subprocess
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, patch
+from typing import Any
 
 import pytest
-import yaml
 
 from dbt_conceptual.config import Config
 from dbt_conceptual.git import (
     GitNotFoundError,
+    GitRunner,
     NotAGitRepoError,
     RefNotFoundError,
     compute_diff_from_ref,
     load_state_from_git_ref,
 )
 
+# conceptual.yml documents served by the fake `git show` or written to disk
+PARTY_MODEL_YAML = """\
+version: 1
+domains:
+  party:
+    name: Party
+    color: "#E3F2FD"
+concepts:
+  customer:
+    name: Customer
+    domain: party
+    owner: team-a
+    definition: A customer
+relationships:
+  - verb: places
+    from: customer
+    to: order
+    cardinality: "1:N"
+"""
+
+CUSTOMER_PARTY_YAML = """\
+version: 1
+concepts:
+  customer:
+    name: Customer
+    domain: party
+domains:
+  party:
+    name: Party
+"""
+
+CUSTOMER_ORDER_YAML = """\
+version: 1
+concepts:
+  customer:
+    name: Customer
+    domain: party
+  order:  # New concept
+    name: Order
+domains:
+  party:
+    name: Party
+"""
+
+CUSTOMER_ONLY_YAML = """\
+version: 1
+concepts:
+  customer:
+    name: Customer
+"""
+
+
+@pytest.fixture(scope="module")
+def git_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """Config for a project whose files the fake git never reads.
+
+    Shared by the module's tests, which must not modify it.
+    """
+    return Config(project_dir=tmp_path_factory.mktemp("git_project"))
+
+
+def _git_runner(
+    show_stdout: str = "", show_returncode: int = 0, show_stderr: str = ""
+) -> GitRunner:
+    """Build a runner that fakes `git show` output and succeeds otherwise."""
+
+    def run(cmd: list[str], **kwargs: Any) -> "subprocess.CompletedProcess[str]":
+        if "show" in cmd:
+            return subprocess.CompletedProcess(
+                cmd, show_returncode, stdout=show_stdout, stderr=show_stderr
+            )
+        return subprocess.CompletedProcess(cmd, 0)
 
-class TestLoadStateFromGitRef:
-    """Tests for load_state_from_git_ref function."""
-
-    def test_raises_git_not_found(self) -> None:
-        """Test that GitNotFoundError is raised when git is not installed."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create minimal config
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
+    return run
 
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump({"version": 1}, f)
 
-            config = Config.load(project_dir=tmppath)
+def _failing_runner(error: Exception) -> GitRunner:
+    """Build a runner that raises error for every git command."""
 
-            # Mock subprocess.run to raise FileNotFoundError (git not found)
-            with patch("subprocess.run") as mock_run:
-                mock_run.side_effect = FileNotFoundError("git not found")
+    def run(cmd: list[str], **kwargs: Any) -> "subprocess.CompletedProcess[str]":
+        raise error
 
-                with pytest.raises(GitNotFoundError) as exc_info:
-                    load_state_from_git_ref(config, "main")
+    return run
 
-                assert "git not found" in str(exc_info.value)
 
-    def test_raises_not_a_git_repo(self) -> None:
-        """Test that NotAGitRepoError is raised when not in a git repo."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+class TestLoadStateFromGitRef:
+    """Tests for load_state_from_git_ref function."""
 
-            # Create minimal config
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
+    def test_raises_git_not_found(self, git_config: Config) -> None:
+        """Test that GitNotFoundError is raised when git is not installed."""
+        runner = _failing_runner(FileNotFoundError("git not found"))
 
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump({"version": 1}, f)
+        with pytest.raises(GitNotFoundError) as exc_info:
+            load_state_from_git_ref(git_config, "main", runner=runner)
 
-            config = Config.load(project_dir=tmppath)
+        assert "git not found" in str(exc_info.value)
 
-            # Mock subprocess.run to fail git rev-parse
-            with patch("subprocess.run") as mock_run:
-                mock_run.side_effect = subprocess.CalledProcessError(
-                    128, "git", stderr=b"not a git repository"
-                )
+    def test_raises_not_a_git_repo(self, git_config: Config) -> None:
+        """Test that NotAGitRepoError is raised when not in a git repo."""
+        runner = _failing_runner(
+            subprocess.CalledProcessError(128, "git", stderr=b"not a git repository")
+        )
 
-                with pytest.raises(NotAGitRepoError) as exc_info:
-                    load_state_from_git_ref(config, "main")
+        with pytest.raises(NotAGitRepoError) as exc_info:
+            load_state_from_git_ref(git_config, "main", runner=runner)
 
-                assert "Not a git repository" in str(exc_info.value)
+        assert "Not a git repository" in str(exc_info.value)
 
-    def test_raises_ref_not_found(self) -> None:
+    def test_raises_ref_not_found(self, git_config: Config) -> None:
         """Test that RefNotFoundError is raised when ref doesn't exist."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create minimal config
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump({"version": 1}, f)
-
-            config = Config.load(project_dir=tmppath)
-
-            def mock_run(*args, **kwargs):  # type: ignore
-                cmd = args[0]
-                if "rev-parse" in cmd:
-                    return MagicMock(returncode=0)
-                elif "show" in cmd:
-                    result = MagicMock()
-                    result.returncode = 128
-                    result.stderr = "fatal: Path 'conceptual.yml' does not exist"
-                    return result
-                return MagicMock(returncode=0)
+        runner = _git_runner(
+            show_returncode=128,
+            show_stderr="fatal: Path 'conceptual.yml' does not exist",
+        )
 
-            with patch("subprocess.run", side_effect=mock_run):
-                with pytest.raises(RefNotFoundError) as exc_info:
-                    load_state_from_git_ref(config, "nonexistent-branch")
+        with pytest.raises(RefNotFoundError) as exc_info:
+            load_state_from_git_ref(git_config, "nonexistent-branch", runner=runner)
 
-                assert exc_info.value.ref == "nonexistent-branch"
+        assert exc_info.value.ref == "nonexistent-branch"
 
-    def test_loads_state_from_ref(self) -> None:
+    def test_loads_state_from_ref(self, git_config: Config) -> None:
         """Test successfully loading state from a git ref."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create minimal config
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump({"version": 1}, f)
-
-            config = Config.load(project_dir=tmppath)
-
-            # Mock git output with conceptual model data
-            mock_yaml = yaml.dump(
-                {
-                    "version": 1,
-                    "domains": {"party": {"name": "Party", "color": "#E3F2FD"}},
-                    "concepts": {
-                        "customer": {
-                            "name": "Customer",
-                            "domain": "party",
-                            "owner": "team-a",
-                            "definition": "A customer",
-                        }
-                    },
-                    "relationships": [
-                        {
-                            "verb": "places",
-                            "from": "customer",
-                            "to": "order",
-                            "cardinality": "1:N",
-                        }
-                    ],
-                }
-            )
+        runner = _git_runner(PARTY_MODEL_YAML)
 
-            def mock_run(*args, **kwargs):  # type: ignore
-                cmd = args[0]
-                if "rev-parse" in cmd:
-                    return MagicMock(returncode=0)
-                elif "show" in cmd:
-                    result = MagicMock()
-                    result.returncode = 0
-                    result.stdout = mock_yaml
-                    return result
-                return MagicMock(returncode=0)
+        state = load_state_from_git_ref(git_config, "main", runner=runner)
 
-            with patch("subprocess.run", side_effect=mock_run):
-                state = load_state_from_git_ref(config, "main")
-
-                assert "customer" in state.concepts
-                assert state.concepts["customer"].name == "Customer"
-                assert state.concepts["customer"].domain == "party"
-                assert "party" in state.domains
-                assert "customer:places:order" in state.relationships
+        assert "customer" in state.concepts
+        assert state.concepts["customer"].name == "Customer"
+        assert state.concepts["customer"].domain == "party"
+        assert "party" in state.domains
+        assert "customer:places:order" in state.relationships
 
 
 class TestComputeDiffFromRef:
     """Tests for compute_diff_from_ref function."""
 
-    def test_computes_diff(self) -> None:
+    def test_computes_diff(self, project_dir: Path) -> None:
         """Test computing diff between current and base state."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            # Create current conceptual.yml
-            current_data = {
-                "version": 1,
-                "concepts": {
-                    "customer": {"name": "Customer", "domain": "party"},
-                    "order": {"name": "Order"},  # New concept
-                },
-                "domains": {"party": {"name": "Party"}},
-            }
-
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump(current_data, f)
-
-            config = Config.load(project_dir=tmppath)
-
-            # Mock base state with only customer concept
-            base_yaml = yaml.dump(
-                {
-                    "version": 1,
-                    "concepts": {"customer": {"name": "Customer", "domain": "party"}},
-                    "domains": {"party": {"name": "Party"}},
-                }
-            )
+        # Current model adds an order concept to the base
+        (project_dir / "conceptual.yml").write_text(CUSTOMER_ORDER_YAML)
+
+        config = Config.load(project_dir=project_dir)
 
-            def mock_run(*args, **kwargs):  # type: ignore
-                cmd = args[0]
-                if "rev-parse" in cmd:
-                    return MagicMock(returncode=0)
-                elif "show" in cmd:
-                    result = MagicMock()
-                    result.returncode = 0
-                    result.stdout = base_yaml
-                    return result
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_run):
-                diff = compute_diff_from_ref(config, "main")
-
-                # Should detect order as added
-                assert diff.has_changes
-                added_concepts = [
-                    c for c in diff.concept_changes if c.change_type == "added"
-                ]
-                assert len(added_concepts) == 1
-                assert added_concepts[0].key == "order"
-
-    def test_no_changes(self) -> None:
+        diff = compute_diff_from_ref(
+            config, "main", runner=_git_runner(CUSTOMER_PARTY_YAML)
+        )
+
+        # Should detect order as added
+        assert diff.has_changes
+        added_concepts = [c for c in diff.concept_changes if c.change_type == "added"]
+        assert len(added_concepts) == 1
+        assert added_concepts[0].key == "order"
+        assert diff.counts["concept"] == {"added": 1}
+
+    def test_no_changes(self, project_dir: Path) -> None:
         """Test diff when there are no changes."""
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create dbt_project.yml
-            with open(tmppath / "dbt_project.yml", "w") as f:
-                yaml.dump({"name": "test"}, f)
-
-            # Create conceptual.yml
-            data = {
-                "version": 1,
-                "concepts": {"customer": {"name": "Customer"}},
-            }
-
-            with open(tmppath / "conceptual.yml", "w") as f:
-                yaml.dump(data, f)
-
-            config = Config.load(project_dir=tmppath)
-
-            # Mock same content in base
-            base_yaml = yaml.dump(data)
-
-            def mock_run(*args, **kwargs):  # type: ignore
-                cmd = args[0]
-                if "rev-parse" in cmd:
-                    return MagicMock(returncode=0)
-                elif "show" in cmd:
-                    result = MagicMock()
-                    result.returncode = 0
-                    result.stdout = base_yaml
-                    return result
-                return MagicMock(returncode=0)
-
-            with patch("subprocess.run", side_effect=mock_run):
-                diff = compute_diff_from_ref(config, "main")
-
-                assert not diff.has_changes
+        # Base ref holds the same content as the working tree
+        (project_dir / "conceptual.yml").write_text(CUSTOMER_ONLY_YAML)
+
+        config = Config.load(project_dir=project_dir)
+
+        diff = compute_diff_from_ref(
+            config, "main", runner=_git_runner(CUSTOMER_ONLY_YAML)
+        )
+
+        assert not diff.has_changes
 
 
 class TestExceptionClasses:
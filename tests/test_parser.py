@@ -34,6 +34,17 @@ def test_parse_empty_conceptual_file() -> None:
         assert len(state.domains) == 0
 
 
+def test_build_with_empty_metadata_key(tmp_path: Path) -> None:
+    """Test an empty metadata: key builds state instead of raising."""
+    (tmp_path / "dbt_project.yml").write_text("name: test\n")
+    (tmp_path / "conceptual.yml").write_text("version: 1\nmetadata:\n")
+
+    config = Config.load(project_dir=tmp_path)
+    state = StateBuilder(config).build()
+
+    assert state.metadata is None
+
+
 def test_parse_conceptual_model_with_domains() -> None:
     """Test parsing conceptual model with domains."""
     with TemporaryDirectory() as tmpdir:
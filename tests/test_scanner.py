@@ -177,3 +177,82 @@ def test_scanner_handles_empty_models_list() -> None:
 
         models = scanner.extract_models_from_schema(schema_data, schema_file)
         assert len(models) == 0
+
+
+def test_scanner_scan_many_files_preserves_order() -> None:
+    """Test that scanning many schema files keeps file discovery order."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        # Create dbt_project.yml
+        with open(tmppath / "dbt_project.yml", "w") as f:
+            yaml.dump({"name": "test"}, f)
+
+        gold_dir = tmppath / "models" / "marts"
+        gold_dir.mkdir(parents=True)
+
+        for i in range(20):
+            with open(gold_dir / f"schema_{i:02d}.yml", "w") as f:
+                yaml.dump({"version": 2, "models": [{"name": f"dim_{i:02d}"}]}, f)
+
+        config = Config.load(project_dir=tmppath)
+        scanner = DbtProjectScanner(config)
+
+        expected = [f"dim_{p.stem.split('_')[1]}" for p in scanner.find_schema_files()]
+        all_models = scanner.scan()
+        assert [m["name"] for m in all_models] == expected
+        assert len(all_models) == 20
+
+
+def test_scanner_scan_collected_files(tmp_path: Path) -> None:
+    """Test scan reuses a collected file list, with overlapping globs deduped."""
+    (tmp_path / "dbt_project.yml").write_text("name: test\n")
+    gold_dir = tmp_path / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    (gold_dir / "schema.yml").write_text("models:\n- name: dim_customer\n")
+
+    config = Config(
+        project_dir=tmp_path, gold_paths=["models/marts/*.yml", "models/marts"]
+    )
+    scanner = DbtProjectScanner(config)
+
+    schema_files = scanner.collect_schema_files()
+    assert schema_files == [gold_dir / "schema.yml"]
+    assert scanner.scan(schema_files) == scanner.scan()
+
+
+def test_scanner_directory_path_finds_yml_and_yaml() -> None:
+    """Test that a directory gold path finds nested .yml and .yaml files."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        # Create dbt_project.yml
+        with open(tmppath / "dbt_project.yml", "w") as f:
+            yaml.dump({"name": "test"}, f)
+
+        gold_dir = tmppath / "models" / "gold"
+        (gold_dir / "nested").mkdir(parents=True)
+        (gold_dir / "schema.yml").write_text("version: 2\n")
+        (gold_dir / "nested" / "models.yaml").write_text("version: 2\n")
+        (gold_dir / "nested" / "model.sql").write_text("select 1\n")
+
+        config = Config(project_dir=tmppath, gold_paths=["models/gold"])
+        scanner = DbtProjectScanner(config)
+
+        names = sorted(f.name for f in scanner.find_schema_files())
+        assert names == ["models.yaml", "schema.yml"]
+
+
+def test_scanner_directory_path_order_matches_rglob(tmp_path: Path) -> None:
+    """Test a directory gold path yields every .yml before any .yaml file."""
+    (tmp_path / "dbt_project.yml").write_text("name: test\n")
+    gold_dir = tmp_path / "models" / "gold"
+    for sub in ("", "a", "a/deep", "b"):
+        (gold_dir / sub).mkdir(parents=True, exist_ok=True)
+        (gold_dir / sub / "first.yaml").write_text("version: 2\n")
+        (gold_dir / sub / "schema.yml").write_text("version: 2\n")
+
+    config = Config(project_dir=tmp_path, gold_paths=["models/gold"])
+    found = list(DbtProjectScanner(config).find_schema_files())
+
+    assert found == [*gold_dir.rglob("*.yml"), *gold_dir.rglob("*.yaml")]
@@ -4,6 +4,8 @@ v1.0: conceptual.yml in project root, gold-only scanning.
 """
 
 import json
+import os
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -13,6 +15,13 @@ import yaml
 from dbt_conceptual.server import create_app
 
 
+def _age(*paths: Path) -> None:
+    """Backdate files past the racy window so their stat can be trusted."""
+    past = time.time() - 60
+    for path in paths:
+        os.utime(path, (past, past))
+
+
 @pytest.fixture
 def temp_project():
     """Create a temporary dbt project for testing."""
@@ -121,14 +130,13 @@ def test_index_route_no_frontend(temp_project, monkeypatch):
     assert b"Frontend build not found" in response.data
 
 
-def test_index_route_with_frontend(temp_project):
+def test_index_route_with_frontend(temp_project, tmp_path):
     """Test index route when frontend build exists."""
     app = create_app(temp_project)
 
-    # Create a mock frontend build
-    static_dir = Path(app.static_folder)
-    static_dir.mkdir(parents=True, exist_ok=True)
-    index_html = static_dir / "index.html"
+    # Create a mock frontend build outside the package tree
+    app.static_folder = str(tmp_path)
+    index_html = tmp_path / "index.html"
     index_html.write_text("<!DOCTYPE html><html><body>React App</body></html>")
 
     client = app.test_client()
@@ -287,3 +295,213 @@ def test_api_state_post_updates_conceptual(temp_project):
     assert "new_concept" in saved_data["concepts"]
     # Status should not be in YAML (it's derived)
     assert "status" not in saved_data["concepts"]["new_concept"]
+
+
+def test_api_coverage_get(temp_project):
+    """Test GET /api/coverage returns the HTML coverage report."""
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    response = client.get("/api/coverage")
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+
+    html = response.get_data(as_text=True)
+    assert html.startswith("<!DOCTYPE html>")
+    assert "Customer" in html
+
+
+def test_api_bus_matrix_get(temp_project):
+    """Test GET /api/bus-matrix returns the HTML bus matrix."""
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    response = client.get("/api/bus-matrix")
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+    assert "</html>" in response.get_data(as_text=True)
+
+
+def test_run_server_uses_waitress(temp_project, monkeypatch):
+    """Test run_server serves the app with Waitress by default."""
+    import waitress
+
+    from dbt_conceptual import server
+
+    calls = {}
+
+    def fake_serve(app, **kwargs):
+        calls.update(kwargs)
+
+    monkeypatch.setattr(waitress, "serve", fake_serve)
+    server.run_server(temp_project, host="127.0.0.1", port=8123)
+
+    assert calls == {
+        "host": "127.0.0.1",
+        "port": 8123,
+        "threads": server.WAITRESS_THREADS,
+    }
+
+
+def test_run_server_debug_uses_flask(temp_project, monkeypatch):
+    """Test run_server --debug uses the Flask development server."""
+    from flask import Flask
+
+    from dbt_conceptual import server
+
+    calls = {}
+
+    def fake_run(self, **kwargs):
+        calls.update(kwargs)
+
+    monkeypatch.setattr(Flask, "run", fake_run)
+    server.run_server(temp_project, port=8123, debug=True)
+
+    assert calls == {"host": "127.0.0.1", "port": 8123, "debug": True}
+
+
+def test_run_server_debug_rejects_public_host(temp_project, monkeypatch):
+    """Test run_server refuses the debug server on a non-loopback host."""
+    from flask import Flask
+
+    from dbt_conceptual import server
+
+    def fake_run(self, **kwargs):
+        raise AssertionError("debug server must not start")
+
+    monkeypatch.setattr(Flask, "run", fake_run)
+    with pytest.raises(ValueError, match="non-loopback"):
+        server.run_server(temp_project, host="0.0.0.0", port=8123, debug=True)
+
+
+def test_cli_serve_debug_rejects_public_host(temp_project, runner, monkeypatch):
+    """Test serve --debug with a non-loopback host is a usage error."""
+    from flask import Flask
+
+    from dbt_conceptual.cli import serve
+
+    def fake_run(self, **kwargs):
+        raise AssertionError("debug server must not start")
+
+    monkeypatch.setattr(Flask, "run", fake_run)
+    result = runner.invoke(
+        serve,
+        ["--project-dir", str(temp_project), "--host", "0.0.0.0", "--debug"],
+    )
+
+    assert result.exit_code == 2
+    assert "--debug is only allowed on a loopback host" in result.output
+
+
+def test_api_state_post_keeps_aliased_config(temp_project):
+    """Test POST /api/state keeps shared config blocks as YAML aliases."""
+    conceptual_file = temp_project / "conceptual.yml"
+    conceptual_file.write_text(
+        "version: 1\n"
+        "config:\n"
+        "  scan:\n"
+        "    gold: &gold\n"
+        "    - models/marts/**/*.yml\n"
+        "  extra_paths: *gold\n"
+        "concepts:\n"
+        "  customer:\n"
+        "    name: Customer\n"
+    )
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    state = client.get("/api/state").get_json()
+    response = client.post("/api/state", json=state)
+    assert response.status_code == 200
+
+    saved_text = conceptual_file.read_text()
+    saved_data = yaml.safe_load(saved_text)
+    assert saved_data["config"]["extra_paths"] == ["models/marts/**/*.yml"]
+    assert saved_data["config"]["scan"]["gold"] is saved_data["config"]["extra_paths"]
+    assert "*" in saved_text.split("extra_paths:")[1].splitlines()[0]
+
+
+def test_api_state_get_not_modified(temp_project):
+    """Test GET /api/state returns 304 while source files are unchanged."""
+    conceptual_file = temp_project / "conceptual.yml"
+    _age(conceptual_file, temp_project / "conceptual_layout.json")
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    response = client.get("/api/state")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/state", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    # Changing conceptual.yml invalidates the ETag
+    with open(conceptual_file, "a") as f:
+        f.write("# edited\n")
+
+    response = client.get("/api/state", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    # A just-written file is not tagged until it leaves the racy window
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    _age(conceptual_file)
+    response = client.get("/api/state", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_api_state_get_racy_same_size_edit(temp_project):
+    """Test a same-size edit keeping the mtime is never answered with 304."""
+    conceptual_file = temp_project / "conceptual.yml"
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    response = client.get("/api/state")
+    assert "ETag" not in response.headers
+
+    # Same size, and on a coarse mtime clock the same mtime as before
+    stat = conceptual_file.stat()
+    text = conceptual_file.read_text()
+    conceptual_file.write_text(text.replace("Customer", "Kunde___"))
+    os.utime(conceptual_file, ns=(stat.st_mtime_ns, stat.st_mtime_ns))
+
+    response = client.get("/api/state", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert response.get_json()["concepts"]["customer"]["name"] == "Kunde___"
+
+
+def test_api_layout_get_not_modified(temp_project):
+    """Test GET /api/layout returns 304 until the layout is saved."""
+    _age(temp_project / "conceptual_layout.json")
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    etag = client.get("/api/layout").headers["ETag"]
+    response = client.get("/api/layout", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    client.post("/api/layout", json={"positions": {"customer": {"x": 1, "y": 2}}})
+    response = client.get("/api/layout", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["customer"]["x"] == 1
+
+
+def test_api_layout_get_missing_file_is_tagged(temp_project):
+    """Test GET /api/layout tags the empty layout and revalidates it."""
+    (temp_project / "conceptual_layout.json").unlink()
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    response = client.get("/api/layout")
+    assert response.get_json() == {"positions": {}}
+    assert response.headers["Cache-Control"] == "no-cache"
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/layout", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    client.post("/api/layout", json={"positions": {"customer": {"x": 1, "y": 2}}})
+    response = client.get("/api/layout", headers={"If-None-Match": etag})
+    assert response.status_code == 200
@@ -1,6 +1,16 @@
 """Tests for state models."""
 
-from dbt_conceptual.state import ConceptState, ProjectState, RelationshipState
+import sys
+from dataclasses import fields
+
+import pytest
+
+from dbt_conceptual.state import (
+    ConceptState,
+    DomainState,
+    ProjectState,
+    RelationshipState,
+)
 
 
 def test_concept_state_creation() -> None:
@@ -91,3 +101,27 @@ def test_project_state_creation() -> None:
     assert state.domains == {}
     assert state.orphan_models == []
     assert state.metadata == {}
+
+
+def test_state_to_dict_covers_all_fields() -> None:
+    """Test to_dict lists every dataclass field in declaration order."""
+    samples = [
+        ConceptState(name="Customer", domain="party", models=["dim_customer"]),
+        RelationshipState(verb="places", from_concept="customer", to_concept="order"),
+        DomainState(name="party", display_name="Party"),
+    ]
+    for state in samples:
+        data = state.to_dict()
+        assert list(data) == [f.name for f in fields(state)]
+        assert data == {f.name: getattr(state, f.name) for f in fields(state)}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses")
+def test_state_classes_are_slotted() -> None:
+    """Test the state dataclasses keep no per-instance __dict__."""
+    assert not hasattr(ConceptState(name="Customer"), "__dict__")
+    assert not hasattr(
+        RelationshipState(verb="places", from_concept="a", to_concept="b"),
+        "__dict__",
+    )
+    assert not hasattr(DomainState(name="party", display_name="Party"), "__dict__")
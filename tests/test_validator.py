@@ -9,8 +9,12 @@ v1.0 Validation Rules:
 - I002: Stub relationship needs enrichment (info)
 """
 
+import sys
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+import pytest
+
 from dbt_conceptual.config import Config, ValidationConfig
 from dbt_conceptual.state import (
     ConceptState,
@@ -19,7 +23,7 @@ from dbt_conceptual.state import (
     ProjectState,
     RelationshipState,
 )
-from dbt_conceptual.validator import Severity, Validator
+from dbt_conceptual.validator import Severity, ValidationIssue, Validator
 
 
 def test_validate_relationship_endpoints() -> None:
@@ -249,3 +253,61 @@ def test_complete_concept_no_warnings() -> None:
         i for i in concept_issues if i.severity in (Severity.WARNING, Severity.ERROR)
     ]
     assert len(warnings_and_errors) == 0
+
+
+def test_validator_has_errors_tracks_assigned_issues() -> None:
+    """Test has_errors follows issues assigned after validation."""
+    config = Config(project_dir=Path("/tmp"))
+    validator = Validator(config, ProjectState())
+    validator.validate()
+    assert validator.has_errors() is False
+
+    validator.issues = [
+        ValidationIssue(severity=Severity.ERROR, code="E002", message="Broken")
+    ]
+    assert validator.has_errors() is True
+
+    validator.validate()
+    assert validator.has_errors() is False
+
+
+def test_validator_has_errors_mixed_severity_batch() -> None:
+    """Test an error anywhere in a recorded batch sets has_errors."""
+    config = Config(project_dir=Path("/tmp"))
+    validator = Validator(config, ProjectState())
+    validator.validate()
+    validator._extend(
+        [
+            ValidationIssue(severity=Severity.WARNING, code="W101", message="Orphan"),
+            ValidationIssue(severity=Severity.ERROR, code="E002", message="Broken"),
+        ]
+    )
+    assert validator.has_errors() is True
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses")
+def test_validation_issue_is_slotted() -> None:
+    """Test ValidationIssue keeps no per-instance __dict__."""
+    issue = ValidationIssue(Severity.WARNING, "W001", "Unknown domain", {"a": 1})
+    assert not hasattr(issue, "__dict__")
+    assert issue == ValidationIssue(
+        severity=Severity.WARNING,
+        code="W001",
+        message="Unknown domain",
+        context={"a": 1},
+    )
+    assert "W001" in repr(issue)
+
+
+def test_validation_issue_is_frozen() -> None:
+    """Test ValidationIssue fields cannot be reassigned."""
+    issue = ValidationIssue(Severity.INFO, "I001", "Needs enrichment")
+    with pytest.raises(FrozenInstanceError):
+        issue.message = "Changed"  # type: ignore[misc]
+
+
+def test_validator_is_slotted() -> None:
+    """Test Validator keeps no per-instance __dict__."""
+    validator = Validator(Config(project_dir=Path("/tmp")), ProjectState())
+    assert not hasattr(validator, "__dict__")
+    assert validator.issues == []